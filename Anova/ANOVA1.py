@@ -1,20 +1,32 @@
-from scipy.stats import f_oneway
+from scipy.stats import f as f_dist
 import numpy as np
 from docx import Document
 from docx.shared import Inches
 from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
+from docx.table import Table
+from xml.sax.saxutils import escape
 import os
+import sys
 from datetime import datetime
-from statsmodels.stats.multicomp import pairwise_tukeyhsd
+from _core import anova_core
 
-def get_user_input():
+# Hardcoded folder path, created once at startup instead of on every save
+SAVE_FOLDER = r"C:\Users\kevin\scipy\Anova\Rafael"
+os.makedirs(SAVE_FOLDER, exist_ok=True)
+
+def get_user_input(ask_filename=True):
     print("🚀 ANOVA REPORT GENERATOR")
     print("=" * 50)
     
     title = input("Enter report title (e.g., ANOVA ANALYSIS RESULTS): ").strip() or "ANOVA ANALYSIS RESULTS"
     subtitle = input("Enter subtitle (e.g., Age Profile vs Strategies in Facilitating): ").strip() or "Age Profile vs Strategies in Facilitating"
-    filename = input("Enter output filename (without .docx): ").strip() or "ANOVA_Results"
-    filename += ".docx"
+    # batch mode asks once per session; later reports return None and land in the batch file
+    filename = None
+    if ask_filename:
+        filename = input("Enter output filename (without .docx): ").strip() or "ANOVA_Results"
+        filename += ".docx"
     
     print("\n📊 Enter data for each age group (space-separated values)")
     print("Example: 3.27 3.47 3.53 3.27 3.6")
@@ -29,38 +41,87 @@ def get_user_input():
                 user_input = input(f"Group {i} ({age_label}): ").strip()
                 if not user_input:
                     print("⚠️  Please enter some values"); continue
-                data_list = [float(x.strip()) for x in user_input.split()]  # space-separated
-                if len(data_list) < 2:
+                data_list = np.fromstring(user_input, sep=' ', dtype=np.float64)  # space-separated, parsed in C
+                if data_list.size != len(user_input.split()): raise ValueError(user_input)  # older numpy truncates instead of raising
+                if data_list.size < 2:
                     print("⚠️  Please enter at least 2 values"); continue
                 all_groups.append(data_list)
-                print(f"✅ Added {len(data_list)} values"); break
+                print(f"✅ Added {data_list.size} values"); break
             except ValueError:
                 print("❌ Invalid input. Please enter numbers only (e.g., 3.27 4.0 2.5)")
     return title, subtitle, filename, all_groups, age_labels
 
-def manual_anova(groups):
-    groups = [np.array(g) for g in groups]
-    all_data = np.concatenate(groups)
-    grand_mean = np.mean(all_data)
-    k = len(groups); N = len(all_data)
+def manual_anova(groups, flat=None):
+    sizes = np.fromiter(map(len, groups), dtype=np.int64)
+    all_data = np.asarray(np.concatenate(groups) if flat is None else flat, dtype=np.float64)
+    k = len(groups); N = all_data.size
+    gid = np.repeat(np.arange(k), sizes)
     
-    SS_total = np.sum((all_data - grand_mean)**2)
-    SS_between = sum(len(g)*(np.mean(g)-grand_mean)**2 for g in groups)
-    SS_within = SS_total - SS_between
+    # single-pass Welford kernel (numba if installed, numpy bincount otherwise)
+    group_means, SS_between, SS_within, F_calculated = anova_core(all_data, gid, k)
+    SS_total = SS_between + SS_within
     
     df_between = k-1; df_within = N-k; df_total = N-1
     MS_between = SS_between / df_between
     MS_within = SS_within / df_within
-    F_calculated = MS_between / MS_within
     
-    return SS_between, SS_within, SS_total, df_between, df_within, MS_between, MS_within, F_calculated
+    return SS_between, SS_within, SS_total, df_between, df_within, MS_between, MS_within, F_calculated, group_means, sizes
+
+def tukey_hsd_fast(group_means, sizes, MS_within, df_within, labels, alpha=0.05):
+    # Tukey-Kramer from the ANOVA summary stats; rows laid out like pairwise_tukeyhsd().summary().data
+    from scipy.stats import studentized_range  # only needed on the significant path
+    group_means = np.asarray(group_means, dtype=np.float64); sizes = np.asarray(sizes)
+    k = group_means.size
+    i, j = np.triu_indices(k, 1)
+    diff = group_means[j] - group_means[i]
+    se = np.sqrt(0.5*MS_within*(1.0/sizes[i] + 1.0/sizes[j]))
+    q = np.abs(diff) / se
+    pvals = studentized_range.sf(q, k, df_within)
+    hsd = studentized_range.ppf(1-alpha, k, df_within) * se
+    
+    header = ['group1','group2','meandiff','p-adj','lower','upper','reject']
+    rows = [[labels[a], labels[b], round(float(d),4), round(float(p),4), round(float(d-h),4), round(float(d+h),4), bool(p<alpha)]
+            for a, b, d, p, h in zip(i, j, diff, pvals, hsd)]
+    return [header] + rows
 
-def create_anova_report(title, subtitle, filename, all_groups, age_labels):
-    SS_between, SS_within, SS_total, df_between, df_within, MS_between, MS_within, F_calculated = manual_anova(all_groups)
-    F_statistic, p_value = f_oneway(*all_groups)
+def fast_table(doc, headers, rows, bold_header=True, style='TableGrid'):
+    # build the whole <w:tbl> as one string and parse it once instead of going through Table/_Cell per cell
+    section = doc.sections[-1]
+    col_w = (section.page_width - section.left_margin - section.right_margin) // len(headers) // 635  # EMU -> twips
+    
+    def tc(val, bold=False):
+        text = escape(str(val))
+        if not text: return f'<w:tc><w:tcPr><w:tcW w:w="{col_w}" w:type="dxa"/></w:tcPr><w:p/></w:tc>'
+        rpr = '<w:rPr><w:b/></w:rPr>' if bold else ''
+        return f'<w:tc><w:tcPr><w:tcW w:w="{col_w}" w:type="dxa"/></w:tcPr><w:p><w:r>{rpr}<w:t xml:space="preserve">{text}</w:t></w:r></w:p></w:tc>'
+    
+    trs = ['<w:tr>' + ''.join(tc(h, bold_header) for h in headers) + '</w:tr>']
+    trs += ['<w:tr>' + ''.join(tc(v) for v in row) + '</w:tr>' for row in rows]
+    grid = f'<w:gridCol w:w="{col_w}"/>' * len(headers)
+    tbl = parse_xml(
+        f'<w:tbl {nsdecls("w")}><w:tblPr><w:tblStyle w:val="{style}"/><w:tblW w:type="auto" w:w="0"/>'
+        f'<w:tblLook w:val="04A0" w:firstRow="1" w:lastRow="0" w:firstColumn="1" w:lastColumn="0" w:noHBand="0" w:noVBand="1"/></w:tblPr>'
+        f'<w:tblGrid>{grid}</w:tblGrid>{"".join(trs)}</w:tbl>')
+    
+    body = doc.element.body
+    if body.sectPr is not None: body.sectPr.addprevious(tbl)  # keep the section properties last
+    else: body.append(tbl)
+    return Table(tbl, doc._body)
+
+def save_report(doc, filename):
+    filepath = os.path.join(SAVE_FOLDER, filename)
+    doc.save(filepath)
+    return filepath
+
+def create_anova_report(title, subtitle, filename, all_groups, age_labels, flat=None, doc=None):
+    # with a shared doc the report is appended and saving is left to the caller
+    if flat is None: flat = np.concatenate(all_groups)
+    SS_between, SS_within, SS_total, df_between, df_within, MS_between, MS_within, F_calculated, group_means, sizes = manual_anova(all_groups, flat)
+    F_statistic = F_calculated; p_value = float(f_dist.sf(F_calculated, df_between, df_within))
     p_value_formatted = "< 0.0001" if p_value<0.0001 else f"{p_value:.6f}"
     
-    doc = Document()
+    save_now = doc is None
+    if save_now: doc = Document()
     
     # Title
     doc_title = doc.add_heading(title, 0)
@@ -73,40 +134,20 @@ def create_anova_report(title, subtitle, filename, all_groups, age_labels):
     
     # Descriptive Statistics Table
     doc.add_heading('Descriptive Statistics', level=2)
-    desc_table = doc.add_table(rows=len(all_groups)+2, cols=4)
-    desc_table.style = 'Table Grid'
-    headers = ['Age Group','Mean','n','Std. Dev']
-    for i,h in enumerate(headers): 
-        desc_table.rows[0].cells[i].text = h
-        for p in desc_table.rows[0].cells[i].paragraphs:
-            for run in p.runs: run.bold=True
-    
-    for i,g in enumerate(all_groups):
-        row = desc_table.rows[i+1].cells
-        mean, std, n = np.mean(g), np.std(g, ddof=1), len(g)
-        row[0].text = age_labels[i]; row[1].text=f"{mean:.3f}"; row[2].text=str(n); row[3].text=f"{std:.4f}"
-    
-    total_cells = desc_table.rows[len(all_groups)+1].cells
-    all_data = np.concatenate(all_groups)
-    total_cells[0].text = "Total"
-    total_cells[1].text = f"{np.mean(all_data):.3f}"
-    total_cells[2].text = str(len(all_data))
-    total_cells[3].text = f"{np.std(all_data, ddof=1):.4f}"
+    # render whole columns at once with np.char instead of one f-string per cell
+    gid = np.repeat(np.arange(sizes.size), sizes)
+    group_stds = np.sqrt(np.bincount(gid, weights=(flat-group_means[gid])**2) / (sizes-1))
+    desc_rows = np.column_stack([age_labels[:sizes.size], np.char.mod('%.3f', group_means), sizes.astype(str), np.char.mod('%.4f', group_stds)]).tolist()
+    desc_rows.append(["Total", f"{flat.mean():.3f}", str(flat.size), f"{flat.std(ddof=1):.4f}"])
+    fast_table(doc, ['Age Group','Mean','n','Std. Dev'], desc_rows)
     
     # ANOVA Table
     doc.add_paragraph()
     doc.add_heading('ANOVA Table', level=2)
-    anova_table = doc.add_table(rows=4, cols=6)
-    anova_table.style='Table Grid'
-    anova_headers=['Source','SS','df','MS','F','p-value']
-    for i,h in enumerate(anova_headers):
-        anova_table.rows[0].cells[i].text = h
-        for p in anova_table.rows[0].cells[i].paragraphs:
-            for run in p.runs: run.bold=True
-    # Fill ANOVA rows
-    anova_table.rows[1].cells[0].text='Treatment'; anova_table.rows[1].cells[1].text=f"{SS_between:.4f}"; anova_table.rows[1].cells[2].text=str(df_between); anova_table.rows[1].cells[3].text=f"{MS_between:.4f}"; anova_table.rows[1].cells[4].text=f"{F_calculated:.2f}"; anova_table.rows[1].cells[5].text=p_value_formatted
-    anova_table.rows[2].cells[0].text='Error'; anova_table.rows[2].cells[1].text=f"{SS_within:.4f}"; anova_table.rows[2].cells[2].text=str(df_within); anova_table.rows[2].cells[3].text=f"{MS_within:.4f}"
-    anova_table.rows[3].cells[0].text='Total'; anova_table.rows[3].cells[1].text=f"{SS_total:.4f}"; anova_table.rows[3].cells[2].text=str(df_between+df_within)
+    fast_table(doc, ['Source','SS','df','MS','F','p-value'], [
+        ['Treatment', f"{SS_between:.4f}", str(df_between), f"{MS_between:.4f}", f"{F_calculated:.2f}", p_value_formatted],
+        ['Error', f"{SS_within:.4f}", str(df_within), f"{MS_within:.4f}", '', ''],
+        ['Total', f"{SS_total:.4f}", str(df_between+df_within), '', '', '']])
     
     # Statistical Interpretation
     doc.add_paragraph(); doc.add_heading('Statistical Interpretation', level=2)
@@ -117,26 +158,18 @@ def create_anova_report(title, subtitle, filename, all_groups, age_labels):
     stats_para.add_run('Alpha level: ').bold=True; stats_para.add_run('0.05\n\n')
     
     decision_para = doc.add_paragraph()
-    posthoc_table = None
+    posthoc_table = None; tukey_data = None
     if p_value<0.05:
         decision_para.add_run('✅ REJECT H₀ → SIGNIFICANT difference\n').bold=True
         decision_para.add_run(f'{subtitle}\n')
         
         # Post Hoc Analysis in DOCX
         doc.add_paragraph(); doc.add_heading('Post Hoc Analysis (Tukey HSD)', level=2)
-        all_values = np.concatenate(all_groups)
-        labels = np.array([[age_labels[i]]*len(g) for i,g in enumerate(all_groups)]).flatten()
-        tukey = pairwise_tukeyhsd(all_values, labels)
-        tukey_data = tukey.summary().data
+        tukey_data = tukey_hsd_fast(group_means, sizes, MS_within, df_within, age_labels)
         
-        posthoc_table = doc.add_table(rows=len(tukey_data), cols=len(tukey_data[0]))
-        posthoc_table.style='Table Grid'
-        for i,row in enumerate(tukey_data):
-            for j,val in enumerate(row):
-                posthoc_table.rows[i].cells[j].text = str(val)
-                if i==0:
-                    for p in posthoc_table.rows[i].cells[j].paragraphs:
-                        for run in p.runs: run.bold=True
+        tk = np.array(tukey_data[1:], dtype=object)
+        tk_num = np.round(tk[:, 2:6].astype(np.float64), 4).astype(str)  # meandiff, p-adj, lower, upper
+        posthoc_table = fast_table(doc, tukey_data[0], np.column_stack([tk[:, :2].astype(str), tk_num, tk[:, 6].astype(str)]).tolist())
     else:
         decision_para.add_run('❌ FAIL TO REJECT H₀ → No significant difference\n').bold=True
     
@@ -149,64 +182,68 @@ def create_anova_report(title, subtitle, filename, all_groups, age_labels):
     else:
         conclusion_para.add_run(f"The ANOVA results indicate no statistically significant difference between the group means for '{subtitle}'.\n").bold=True
     
-    # Hardcoded folder path
-    save_folder = "C:\\Users\\kevin\\scipy\\Anova\\Rafael"
-    if not os.path.exists(save_folder):
-        os.makedirs(save_folder)
-
-    # Full file path
-    filepath = os.path.join(save_folder, filename)
-
     # Save the document
-    doc.save(filepath)
+    if save_now: filename = save_report(doc, filename)
 
-    return filename, F_calculated, p_value_formatted, SS_between, SS_within, p_value, df_between, df_within, MS_between, MS_within, posthoc_table
+    return filename, F_calculated, p_value_formatted, SS_between, SS_within, p_value, df_between, df_within, MS_between, MS_within, posthoc_table, tukey_data
 
-def main():
-    while True:
-        title, subtitle, filename, all_groups, age_labels = get_user_input()
-        output_file, F_value, p_value_str, SS_between, SS_within, p_val_num, df_between, df_within, MS_between, MS_within, posthoc_table = create_anova_report(title, subtitle, filename, all_groups, age_labels)
-        
-        print("\n✅ DOCUMENT CREATED:", os.path.abspath(output_file))
-        
-        # Descriptive Statistics
-        print("\nDESCRIPTIVE STATISTICS:")
-        print(f"{'Age Group':<12} {'Mean':<8} {'n':<4} {'Std Dev':<8}")
-        for i,g in enumerate(all_groups):
-            print(f"{age_labels[i]:<12} {np.mean(g):<8.3f} {len(g):<4} {np.std(g, ddof=1):<8.4f}")
-        print(f"{'Total':<12} {np.mean(np.concatenate(all_groups)):<8.3f} {len(np.concatenate(all_groups)):<4} {np.std(np.concatenate(all_groups), ddof=1):<8.4f}")
-        
-        # ANOVA Table
-        print("\nANOVA TABLE:")
-        print(f"{'Source':<12} {'SS':<10} {'df':<6} {'MS':<10} {'F':<10} {'p-value':<12}")
-        print(f"{'Treatment':<12} {SS_between:<10.4f} {df_between:<6} {MS_between:<10.4f} {F_value:<10.2f} {p_value_str:<12}")
-        print(f"{'Error':<12} {SS_within:<10.4f} {df_within:<6} {MS_within:<10.4f}")
-        print(f"{'Total':<12} {SS_between+SS_within:<10.4f} {df_between+df_within:<6}")
-        
-        # Post Hoc Analysis
-        if p_val_num<0.05:
-            print("\n✅ SIGNIFICANT → Performing Post Hoc (Tukey HSD)")
-            all_values = np.concatenate(all_groups)
-            labels = np.array([[age_labels[i]]*len(g) for i,g in enumerate(all_groups)]).flatten()
-            tukey = pairwise_tukeyhsd(all_values, labels)
-            tukey_data = tukey.summary().data
-            print("\nPOST HOC ANALYSIS (Tukey HSD):")
-            header = tukey_data[0]
-            rows = tukey_data[1:]
-            print(f"{header[0]:<12} {header[1]:<12} {header[2]:<12} {header[3]:<10} {header[4]:<10} {header[5]:<10} {header[6]:<10}")
-            for r in rows:
-                print(f"{r[0]:<12} {r[1]:<12} {r[2]:<12} {r[3]:<10.4f} {r[4]:<10.4f} {r[5]:<10} {r[6]:<10}")
-            print("\nCONCLUSION:")
-            print(f"The ANOVA results indicate a statistically significant difference between the group means for '{subtitle}'.")
-            print("Post Hoc (Tukey HSD) identifies which specific groups differ significantly.")
-        else:
-            print("\n❌ NOT SIGNIFICANT → Post Hoc not performed")
-            print("\nCONCLUSION:")
-            print(f"The ANOVA results indicate no statistically significant difference between the group means for '{subtitle}'.")
-        
-        another = input("\n🔄 Create another report? (y/n): ").strip().lower()
-        if another not in ['y','yes']:
-            break
+def main(per_report_save=False):
+    # batch mode: every report is appended to one Document that is serialized once on exit
+    batch_doc = None if per_report_save else Document()
+    batch_filename = None
+    try:
+        while True:
+            title, subtitle, filename, all_groups, age_labels = get_user_input(ask_filename=batch_filename is None)
+            flat = np.concatenate(all_groups)
+            N, overall_mean, overall_std = flat.size, flat.mean(), flat.std(ddof=1)
+            if batch_doc is not None:
+                if batch_filename is None:
+                    batch_filename = f"{os.path.splitext(filename)[0]}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.docx"
+                    print("\n📄 All reports this session go to:", os.path.abspath(os.path.join(SAVE_FOLDER, batch_filename)))
+                    print("   (run with --per-report-save to name each report's file)")
+                else: batch_doc.add_page_break()
+            output_file, F_value, p_value_str, SS_between, SS_within, p_val_num, df_between, df_within, MS_between, MS_within, posthoc_table, tukey_data = create_anova_report(title, subtitle, filename, all_groups, age_labels, flat, batch_doc)
+            
+            if per_report_save: print("\n✅ DOCUMENT CREATED:", os.path.abspath(output_file))
+            else: print("\n✅ REPORT ADDED to batch document (saved on exit)")
+            
+            # Descriptive Statistics
+            print("\nDESCRIPTIVE STATISTICS:")
+            print(f"{'Age Group':<12} {'Mean':<8} {'n':<4} {'Std Dev':<8}")
+            for i,g in enumerate(all_groups):
+                print(f"{age_labels[i]:<12} {np.mean(g):<8.3f} {len(g):<4} {np.std(g, ddof=1):<8.4f}")
+            print(f"{'Total':<12} {overall_mean:<8.3f} {N:<4} {overall_std:<8.4f}")
+            
+            # ANOVA Table
+            print("\nANOVA TABLE:")
+            print(f"{'Source':<12} {'SS':<10} {'df':<6} {'MS':<10} {'F':<10} {'p-value':<12}")
+            print(f"{'Treatment':<12} {SS_between:<10.4f} {df_between:<6} {MS_between:<10.4f} {F_value:<10.2f} {p_value_str:<12}")
+            print(f"{'Error':<12} {SS_within:<10.4f} {df_within:<6} {MS_within:<10.4f}")
+            print(f"{'Total':<12} {SS_between+SS_within:<10.4f} {df_between+df_within:<6}")
+            
+            # Post Hoc Analysis
+            if tukey_data is not None:
+                print("\n✅ SIGNIFICANT → Performing Post Hoc (Tukey HSD)")
+                print("\nPOST HOC ANALYSIS (Tukey HSD):")
+                header = tukey_data[0]
+                rows = tukey_data[1:]
+                print(f"{header[0]:<12} {header[1]:<12} {header[2]:<12} {header[3]:<10} {header[4]:<10} {header[5]:<10} {header[6]:<10}")
+                for r in rows:
+                    print(f"{r[0]:<12} {r[1]:<12} {r[2]:<12} {r[3]:<10.4f} {r[4]:<10.4f} {r[5]:<10} {str(r[6]):<10}")
+                print("\nCONCLUSION:")
+                print(f"The ANOVA results indicate a statistically significant difference between the group means for '{subtitle}'.")
+                print("Post Hoc (Tukey HSD) identifies which specific groups differ significantly.")
+            else:
+                print("\n❌ NOT SIGNIFICANT → Post Hoc not performed")
+                print("\nCONCLUSION:")
+                print(f"The ANOVA results indicate no statistically significant difference between the group means for '{subtitle}'.")
+            
+            another = input("\n🔄 Create another report? (y/n): ").strip().lower()
+            if another not in ['y','yes']:
+                break
+    finally:
+        if batch_filename is not None:
+            print("\n✅ DOCUMENT CREATED:", os.path.abspath(save_report(batch_doc, batch_filename)))
 
 if __name__=="__main__":
-    main()
+    main(per_report_save="--per-report-save" in sys.argv[1:])
@@ -0,0 +1,63 @@
+"""
+One-way ANOVA kernel shared by the ANOVA report scripts.
+Uses a Numba-compiled single-pass Welford loop when numba is installed,
+otherwise falls back to the vectorized NumPy bincount path.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _anova_core_numpy(flat, gid, k):
+    """NumPy fallback: group sums via bincount, SS via the computational formula."""
+    sizes = np.bincount(gid, minlength=k)
+    group_sums = np.bincount(gid, weights=flat, minlength=k)
+    group_means = group_sums / sizes
+    N = flat.size
+    grand_mean = group_sums.sum() / N
+
+    SS_total = np.dot(flat, flat) - N * grand_mean ** 2
+    SS_between = np.dot(sizes, (group_means - grand_mean) ** 2)
+    SS_within = SS_total - SS_between
+    F = (SS_between / (k - 1)) / (SS_within / (N - k))
+    return group_means, SS_between, SS_within, F
+
+
+def _anova_core_loop(flat, gid, k):
+    """Single pass over the data keeping per-group and global Welford running moments."""
+    n = np.zeros(k, dtype=np.int64)
+    mean = np.zeros(k)
+    m2 = np.zeros(k)
+    gn = 0
+    gmean = 0.0
+
+    for idx in range(flat.size):
+        x = flat[idx]
+        g = gid[idx]
+
+        n[g] += 1
+        delta = x - mean[g]
+        mean[g] += delta / n[g]
+        m2[g] += delta * (x - mean[g])
+
+        gn += 1
+        gmean += (x - gmean) / gn
+
+    SS_within = 0.0
+    SS_between = 0.0
+    for g in range(k):
+        SS_within += m2[g]
+        SS_between += n[g] * (mean[g] - gmean) ** 2
+
+    F = (SS_between / (k - 1)) / (SS_within / (gn - k))
+    return mean, SS_between, SS_within, F
+
+
+if njit is not None:
+    anova_core = njit(cache=True, fastmath=True)(_anova_core_loop)
+else:
+    anova_core = _anova_core_numpy
@@ -1,9 +1,11 @@
-from scipy.stats import f_oneway
+from scipy.stats import f as f_dist
 import numpy as np
 from docx import Document
 from docx.shared import Inches
+from docx.oxml import OxmlElement
 import os
 from datetime import datetime
+from _core import anova_core
 
 def get_user_input():
     """
@@ -75,21 +77,16 @@ def manual_anova(groups):
     """
     Calculate ANOVA manually to get SS, MS values
     """
-    groups = [np.array(group) for group in groups]
-    all_data = np.concatenate(groups)
-    grand_mean = np.mean(all_data)
+    sizes = np.fromiter(map(len, groups), dtype=np.int64)
+    all_data = np.concatenate(groups).astype(np.float64)
     k = len(groups)
-    N = len(all_data)
+    N = all_data.size
     
-    SS_total = np.sum((all_data - grand_mean) ** 2)
+    # Group id for every observation, consumed by the single-pass kernel
+    gid = np.repeat(np.arange(k), sizes)
+    group_means, SS_between, SS_within, F_calculated = anova_core(all_data, gid, k)
     
-    SS_between = 0
-    for group in groups:
-        n_i = len(group)
-        group_mean = np.mean(group)
-        SS_between += n_i * (group_mean - grand_mean) ** 2
-    
-    SS_within = SS_total - SS_between
+    SS_total = SS_between + SS_within
     
     df_between = k - 1
     df_within = N - k
@@ -98,17 +95,44 @@ def manual_anova(groups):
     MS_between = SS_between / df_between
     MS_within = SS_within / df_within
     
-    F_calculated = MS_between / MS_within
-    
     return SS_between, SS_within, SS_total, df_between, df_within, MS_between, MS_within, F_calculated
 
+def set_cell_text_fast(tc, text):
+    """
+    Write text into a freshly created (empty) table cell without cell.text's clear-and-rebuild
+    """
+    if not text:
+        return
+    p = tc.p_lst[-1] if tc.p_lst else tc.add_p()
+    r = OxmlElement('w:r')
+    t = OxmlElement('w:t')
+    t.text = text
+    r.append(t)
+    p.append(r)
+
+def fill_row(row, values):
+    """
+    Write one value per cell directly into the row's <w:tc> elements
+    """
+    for tc, value in zip(row._tr.tc_lst, values):
+        set_cell_text_fast(tc, value)
+
+def bold_header_row(tbl_element):
+    """
+    Bold every run in the first row of a table with one XPath query
+    """
+    for run in tbl_element.xpath('./w:tr[1]/w:tc//w:r'):
+        run.get_or_add_rPr().get_or_add_b()
+
 def create_anova_report(title, subtitle, filename, all_groups, age_labels):
     """
     Create ANOVA DOCX report with custom title, subtitle, and filename
     """
     # Calculate ANOVA
     SS_between, SS_within, SS_total, df_between, df_within, MS_between, MS_within, F_calculated = manual_anova(all_groups)
-    F_statistic, p_value = f_oneway(*all_groups)
+    # p-value straight from the F distribution instead of re-running f_oneway
+    F_statistic = F_calculated
+    p_value = float(f_dist.sf(F_calculated, df_between, df_within))
     
     # Format p-value
     if p_value < 0.0001:
@@ -142,37 +166,25 @@ def create_anova_report(title, subtitle, filename, all_groups, age_labels):
     desc_table.style = 'Table Grid'
     
     # Header row
-    header_cells = desc_table.rows[0].cells
-    headers = ['Age Group', 'Mean', 'n', 'Std. Dev']
-    for i, header in enumerate(headers):
-        header_cells[i].text = header
-        for paragraph in header_cells[i].paragraphs:
-            for run in paragraph.runs:
-                run.bold = True
+    desc_rows = desc_table.rows
+    fill_row(desc_rows[0], ['Age Group', 'Mean', 'n', 'Std. Dev'])
+    bold_header_row(desc_table._tbl)
     
     # Data rows for each group
     for i, group in enumerate(all_groups):
-        row_cells = desc_table.rows[i+1].cells
         mean = np.mean(group)
         std_dev = np.std(group, ddof=1)
         n = len(group)
         
-        row_cells[0].text = age_labels[i]
-        row_cells[1].text = f"{mean:.3f}"
-        row_cells[2].text = str(n)
-        row_cells[3].text = f"{std_dev:.4f}"
+        fill_row(desc_rows[i+1], [age_labels[i], f"{mean:.3f}", str(n), f"{std_dev:.4f}"])
     
     # Total row
-    total_cells = desc_table.rows[len(all_groups)+1].cells
     all_data = np.concatenate(all_groups)
     overall_mean = np.mean(all_data)
     overall_std = np.std(all_data, ddof=1)
     total_n = len(all_data)
     
-    total_cells[0].text = "Total"
-    total_cells[1].text = f"{overall_mean:.3f}"
-    total_cells[2].text = str(total_n)
-    total_cells[3].text = f"{overall_std:.4f}"
+    fill_row(desc_rows[len(all_groups)+1], ["Total", f"{overall_mean:.3f}", str(total_n), f"{overall_std:.4f}"])
     
     doc.add_paragraph()  # Empty line
     
@@ -184,38 +196,15 @@ def create_anova_report(title, subtitle, filename, all_groups, age_labels):
     anova_table.style = 'Table Grid'
     
     # Header row
-    anova_header = anova_table.rows[0].cells
-    anova_headers = ['Source', 'SS', 'df', 'MS', 'F', 'p-value']
-    for i, header in enumerate(anova_headers):
-        anova_header[i].text = header
-        for paragraph in anova_header[i].paragraphs:
-            for run in paragraph.runs:
-                run.bold = True
+    anova_rows = anova_table.rows
+    fill_row(anova_rows[0], ['Source', 'SS', 'df', 'MS', 'F', 'p-value'])
+    bold_header_row(anova_table._tbl)
     
     # Data rows
-    treatment_cells = anova_table.rows[1].cells
-    treatment_cells[0].text = 'Treatment'
-    treatment_cells[1].text = f"{SS_between:.4f}"
-    treatment_cells[2].text = str(df_between)
-    treatment_cells[3].text = f"{MS_between:.4f}"
-    treatment_cells[4].text = f"{F_calculated:.2f}"
-    treatment_cells[5].text = p_value_formatted
-    
-    error_cells = anova_table.rows[2].cells
-    error_cells[0].text = 'Error'
-    error_cells[1].text = f"{SS_within:.4f}"
-    error_cells[2].text = str(df_within)
-    error_cells[3].text = f"{MS_within:.4f}"
-    error_cells[4].text = ''
-    error_cells[5].text = ''
-    
-    total_cells_anova = anova_table.rows[3].cells
-    total_cells_anova[0].text = 'Total'
-    total_cells_anova[1].text = f"{SS_total:.4f}"
-    total_cells_anova[2].text = str(df_between + df_within)
-    total_cells_anova[3].text = ''
-    total_cells_anova[4].text = ''
-    total_cells_anova[5].text = ''
+    fill_row(anova_rows[1], ['Treatment', f"{SS_between:.4f}", str(df_between),
+                             f"{MS_between:.4f}", f"{F_calculated:.2f}", p_value_formatted])
+    fill_row(anova_rows[2], ['Error', f"{SS_within:.4f}", str(df_within), f"{MS_within:.4f}", '', ''])
+    fill_row(anova_rows[3], ['Total', f"{SS_total:.4f}", str(df_between + df_within), '', '', ''])
     
     doc.add_paragraph()  # Empty line
     
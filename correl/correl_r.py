@@ -2,10 +2,21 @@
 # in Excel = CORREL(array1, array2)
 
 import numpy as np
-from scipy.stats import pearsonr
+
+
+def pearson_r(x, y):
+    # Same value as CORREL / pearsonr, from two mean-centered dot products
+    dx = np.asarray(x, dtype=float) - np.mean(x)
+    dy = np.asarray(y, dtype=float) - np.mean(y)
+    return np.dot(dx, dy) / np.sqrt(np.dot(dx, dx) * np.dot(dy, dy))
+
 
 x = [1, 2, 3, 4, 5]
 y = [2, 3, 5, 7, 9]
 
-r, p = pearsonr(x, y)
-print(f"Computed value: {r}")  # observed r
+if __name__ == "__main__":
+    from scipy.stats import pearsonr
+
+    r, p = pearsonr(x, y)
+    print(f"Computed value: {r}")  # observed r
+    print(f"Hand-rolled value: {pearson_r(x, y)}")  # same r via np.dot
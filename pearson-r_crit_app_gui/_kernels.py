@@ -0,0 +1,35 @@
+"""
+Compiled kernels shared by the Pearson r calculator.
+Uses a Numba-compiled parallel loop when numba is installed,
+otherwise falls back to the equivalent NumPy expression.
+"""
+
+import math
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+
+def _r_from_t_loop(t_crit, df, out):
+    """Elementwise r = sqrt(t² / (t² + df)) written into out."""
+    for i in prange(t_crit.size):
+        t2 = t_crit[i] * t_crit[i]
+        out[i] = math.sqrt(t2 / (t2 + df[i]))
+    return out
+
+
+def _r_from_t_numpy(t_crit, df, out):
+    """NumPy fallback for r_from_t when numba is not installed."""
+    t2 = t_crit * t_crit
+    np.sqrt(t2 / (t2 + df), out=out)
+    return out
+
+
+if njit is not None:
+    r_from_t = njit(parallel=True, fastmath=True, cache=True)(_r_from_t_loop)
+else:
+    r_from_t = _r_from_t_numpy
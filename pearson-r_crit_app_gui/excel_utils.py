@@ -5,11 +5,72 @@ Contains functions for reading and analyzing Excel files for correlation analysi
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Tuple, Optional
-from scipy.stats import pearsonr
+from functools import lru_cache
+from typing import Dict, List, Set, Tuple, Optional
+import math
+import os
 
 
-def read_excel_file(filepath: str) -> Tuple[bool, pd.DataFrame, str]:
+def _pearson_core_loop(x: np.ndarray, y: np.ndarray) -> Tuple[float, int]:
+    """
+    Pearson r from two float64 arrays using explicit sums (compiled with numba when available).
+    """
+    n = x.size
+    mx = 0.0
+    my = 0.0
+    for i in range(n):
+        mx += x[i]
+        my += y[i]
+    mx /= n
+    my /= n
+    
+    sxx = 0.0
+    syy = 0.0
+    sxy = 0.0
+    for i in range(n):
+        dx = x[i] - mx
+        dy = y[i] - my
+        sxx += dx * dx
+        syy += dy * dy
+        sxy += dx * dy
+    
+    return sxy / math.sqrt(sxx * syy), n
+
+
+def _pearson_core_numpy(x: np.ndarray, y: np.ndarray) -> Tuple[float, int]:
+    """
+    NumPy fallback for _pearson_core when numba is not installed.
+    """
+    dx = x - x.mean()
+    dy = y - y.mean()
+    return float(np.dot(dx, dy) / math.sqrt(np.dot(dx, dx) * np.dot(dy, dy))), x.size
+
+
+# Implementation picked by _get_pearson_core on first use
+_pearson_core = None
+
+
+def _get_pearson_core():
+    """
+    Return the Pearson core, compiling it with numba the first time it is needed.
+    
+    numba is imported here rather than at module level so that loading this
+    module (which the GUI does at startup) doesn't pay for it.
+    """
+    global _pearson_core
+    if _pearson_core is None:
+        try:
+            from numba import njit
+        except ImportError:
+            _pearson_core = _pearson_core_numpy
+        else:
+            _pearson_core = njit(cache=True, fastmath=True)(_pearson_core_loop)
+    return _pearson_core
+
+
+def read_excel_file(filepath: str, engine: Optional[str] = None,
+                    read_only: bool = True,
+                    usecols: Optional[List[str]] = None) -> Tuple[bool, pd.DataFrame, str]:
     """
     Read an Excel file and return its contents.
     
@@ -17,13 +78,25 @@ def read_excel_file(filepath: str) -> Tuple[bool, pd.DataFrame, str]:
     -----------
     filepath : str
         Path to the Excel file
+    engine : str, optional
+        Preferred pandas engine, e.g. "calamine". Falls back to openpyxl
+        if the engine is not installed.
+    read_only : bool
+        Open .xlsx workbooks in openpyxl read-only (streaming) mode
+    usecols : list, optional
+        Only parse these columns
         
     Returns:
     --------
     tuple : (success, dataframe, error_message)
     """
     try:
-        df = pd.read_excel(filepath)
+        try:
+            df = pd.read_excel(filepath, engine=engine, usecols=usecols)
+        except ImportError:
+            if engine is None:
+                raise
+            df = _read_excel_openpyxl(filepath, read_only, usecols)
         
         if df.empty:
             return False, None, "The Excel file is empty"
@@ -36,6 +109,56 @@ def read_excel_file(filepath: str) -> Tuple[bool, pd.DataFrame, str]:
         return False, None, f"Error reading Excel file: {str(e)}"
 
 
+def _read_excel_openpyxl(filepath: str, read_only: bool,
+                         usecols: Optional[List[str]] = None) -> pd.DataFrame:
+    """Read with openpyxl for .xlsx/.xlsm files, otherwise let pandas pick the engine."""
+    if filepath.lower().endswith(('.xlsx', '.xlsm')):
+        return pd.read_excel(filepath, engine="openpyxl", usecols=usecols,
+                             engine_kwargs={"read_only": read_only})
+    return pd.read_excel(filepath, usecols=usecols)
+
+
+@lru_cache(maxsize=4)
+def _load_df(filepath: str, mtime: float, engine: Optional[str], read_only: bool) -> pd.DataFrame:
+    """Parse a workbook once per (filepath, mtime); failures raise so they are never cached."""
+    success, df, error = read_excel_file(filepath, engine=engine, read_only=read_only)
+    if not success:
+        raise ValueError(error)
+    return df
+
+
+def read_excel_file_cached(filepath: str, engine: Optional[str] = None,
+                           read_only: bool = True) -> Tuple[bool, pd.DataFrame, str]:
+    """
+    Read an Excel file, reusing the parsed DataFrame while the file is unchanged.
+    
+    The four most recent workbooks are kept in memory, keyed by path and
+    modification time, so an edited file is always parsed again.
+    
+    Parameters:
+    -----------
+    filepath : str
+        Path to the Excel file
+    engine : str, optional
+        Preferred pandas engine (see read_excel_file)
+    read_only : bool
+        Open .xlsx workbooks in openpyxl read-only mode
+        
+    Returns:
+    --------
+    tuple : (success, dataframe, error_message)
+    """
+    try:
+        mtime = os.path.getmtime(filepath)
+    except OSError:
+        return read_excel_file(filepath, engine=engine, read_only=read_only)
+    
+    try:
+        return True, _load_df(filepath, mtime, engine, read_only), ""
+    except ValueError as e:
+        return False, None, str(e)
+
+
 def get_numeric_columns(df: pd.DataFrame) -> List[str]:
     """
     Get list of numeric columns from dataframe.
@@ -52,7 +175,30 @@ def get_numeric_columns(df: pd.DataFrame) -> List[str]:
     return df.select_dtypes(include=[np.number]).columns.tolist()
 
 
-def validate_columns_for_correlation(df: pd.DataFrame, col1: str, col2: str) -> Tuple[bool, str]:
+def get_paired_values(df: pd.DataFrame, col1: str, col2: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Extract two numeric columns as float arrays, keeping only rows where both are present.
+    
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        Input dataframe
+    col1, col2 : str
+        Numeric column names
+        
+    Returns:
+    --------
+    tuple : (x, y) arrays of equal length with no NaN values
+    """
+    x = df[col1].to_numpy(dtype=np.float64, na_value=np.nan)
+    y = df[col2].to_numpy(dtype=np.float64, na_value=np.nan)
+    mask = ~(np.isnan(x) | np.isnan(y))
+    return x[mask], y[mask]
+
+
+def validate_columns_for_correlation(df: pd.DataFrame, col1: str, col2: str,
+                                     paired: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+                                     numeric_cols: Optional[Set[str]] = None) -> Tuple[bool, str]:
     """
     Validate that two columns are suitable for correlation analysis.
     
@@ -62,6 +208,10 @@ def validate_columns_for_correlation(df: pd.DataFrame, col1: str, col2: str) ->
         Input dataframe
     col1, col2 : str
         Column names to validate
+    paired : tuple, optional
+        Precomputed (x, y) from get_paired_values, reused instead of re-extracting
+    numeric_cols : set, optional
+        Precomputed set of numeric column names (from get_numeric_columns)
         
     Returns:
     --------
@@ -75,30 +225,34 @@ def validate_columns_for_correlation(df: pd.DataFrame, col1: str, col2: str) ->
         return False, f"Column '{col2}' not found in the Excel file"
     
     # Check if columns are numeric
-    if not np.issubdtype(df[col1].dtype, np.number):
+    if numeric_cols is None:
+        numeric_cols = set(get_numeric_columns(df))
+    
+    if col1 not in numeric_cols:
         return False, f"Column '{col1}' is not numeric"
     
-    if not np.issubdtype(df[col2].dtype, np.number):
+    if col2 not in numeric_cols:
         return False, f"Column '{col2}' is not numeric"
     
     # Drop NaN values for analysis
-    clean_data = df[[col1, col2]].dropna()
+    x, y = paired if paired is not None else get_paired_values(df, col1, col2)
     
     # Check if we have enough data points
-    if len(clean_data) < 3:
-        return False, f"Not enough valid data points (need at least 3, found {len(clean_data)})"
+    if len(x) < 3:
+        return False, f"Not enough valid data points (need at least 3, found {len(x)})"
     
-    # Check for zero variance
-    if clean_data[col1].std() == 0:
+    # Check for zero variance (peak-to-peak is cheaper than a full std)
+    if np.ptp(x) == 0:
         return False, f"Column '{col1}' has zero variance (all values are the same)"
     
-    if clean_data[col2].std() == 0:
+    if np.ptp(y) == 0:
         return False, f"Column '{col2}' has zero variance (all values are the same)"
     
     return True, ""
 
 
-def compute_correlation_from_data(df: pd.DataFrame, col1: str, col2: str) -> Dict:
+def compute_correlation_from_data(df: pd.DataFrame, col1: str, col2: str,
+                                  paired: Optional[Tuple[np.ndarray, np.ndarray]] = None) -> Dict:
     """
     Compute Pearson correlation coefficient from two columns of data.
     
@@ -108,23 +262,28 @@ def compute_correlation_from_data(df: pd.DataFrame, col1: str, col2: str) -> Dic
         Input dataframe
     col1, col2 : str
         Column names to correlate
+    paired : tuple, optional
+        Precomputed (x, y) from get_paired_values, reused instead of re-extracting
         
     Returns:
     --------
     dict : Dictionary containing correlation results
     """
-    # Remove rows with NaN values in either column
-    clean_data = df[[col1, col2]].dropna()
+    # Imported on first use so loading this module doesn't pull in scipy
+    from scipy.special import stdtr
     
-    # Extract the two variables
-    x = clean_data[col1].values
-    y = clean_data[col2].values
+    # Extract the two variables without rows that have NaN in either column
+    x, y = paired if paired is not None else get_paired_values(df, col1, col2)
     
-    # Compute Pearson correlation
-    r_value, p_value = pearsonr(x, y)
+    # Compute Pearson correlation (r in the compiled core, p from the Student t CDF)
+    r_value, n = _get_pearson_core()(x, y)
+    r_value = min(max(r_value, -1.0), 1.0)
     
-    # Get sample size
-    n = len(x)
+    if abs(r_value) == 1.0:
+        p_value = 0.0
+    else:
+        t_stat = r_value * math.sqrt((n - 2) / (1 - r_value**2))
+        p_value = float(2 * stdtr(n - 2, -abs(t_stat)))
     
     return {
         'column_1': col1,
@@ -139,7 +298,8 @@ def compute_correlation_from_data(df: pd.DataFrame, col1: str, col2: str) -> Dic
 
 def analyze_excel_correlation(filepath: str, col1: str, col2: str, 
                               alpha: float = 0.05, 
-                              test_type: str = "two-tailed") -> Tuple[bool, Dict, str]:
+                              test_type: str = "two-tailed",
+                              df: Optional[pd.DataFrame] = None) -> Tuple[bool, Dict, str]:
     """
     Complete analysis pipeline: read Excel file, compute correlation, and determine significance.
     
@@ -153,6 +313,8 @@ def analyze_excel_correlation(filepath: str, col1: str, col2: str,
         Significance level
     test_type : str
         Type of test ("two-tailed" or "one-tailed")
+    df : pd.DataFrame, optional
+        Already parsed contents of filepath; the file is read if omitted
         
     Returns:
     --------
@@ -160,10 +322,14 @@ def analyze_excel_correlation(filepath: str, col1: str, col2: str,
     """
     from stats_utils import compute_pearson_r_critical
     
-    # Read Excel file
-    success, df, error = read_excel_file(filepath)
-    if not success:
-        return False, None, error
+    # Read Excel file (only the two columns being correlated)
+    if df is None:
+        success, df, error = read_excel_file(filepath, read_only=True, usecols=[col1, col2])
+        if not success:
+            # Full read so a missing column gets the usual validation message
+            success, df, error = read_excel_file(filepath)
+        if not success:
+            return False, None, error
     
     # Validate columns
     is_valid, error = validate_columns_for_correlation(df, col1, col2)
@@ -216,8 +382,9 @@ def get_all_correlation_pairs(df: pd.DataFrame, alpha: float = 0.05,
     --------
     list : List of dictionaries containing correlation results for each pair
     """
-    from stats_utils import compute_pearson_r_critical
+    from stats_utils import compute_pearson_r_critical, compute_pearson_r_critical_batch
     from itertools import combinations
+    from scipy.special import stdtr
     
     numeric_cols = get_numeric_columns(df)
     
@@ -226,30 +393,79 @@ def get_all_correlation_pairs(df: pd.DataFrame, alpha: float = 0.05,
     
     results = []
     
+    X = df[numeric_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+    
+    if not np.isnan(X).any():
+        # No missing data: every pair shares the same n, so a single Xc.T @ Xc
+        # product of the centered, unit-norm columns gives every r at once
+        n = X.shape[0]
+        if n < 3:
+            return []
+        
+        constant = np.ptp(X, axis=0) == 0
+        Xc = X - X.mean(axis=0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            Xc /= np.linalg.norm(Xc, axis=0)
+            R = np.clip(Xc.T @ Xc, -1.0, 1.0)
+            t_stats = R * np.sqrt((n - 2) / (1 - R**2))
+        P = np.clip(2 * stdtr(n - 2, -np.abs(t_stats)), 0.0, 1.0)
+        # Perfect correlation: p is 0, as in compute_correlation_from_data
+        P[np.abs(R) == 1.0] = 0.0
+        critical_results = compute_pearson_r_critical(n, alpha, test_type)
+        
+        for i, j in combinations(range(len(numeric_cols)), 2):
+            if constant[i] or constant[j]:
+                continue
+            
+            r_value = float(R[i, j])
+            results.append({
+                'column_1': numeric_cols[i],
+                'column_2': numeric_cols[j],
+                'sample_size': n,
+                'r_value': r_value,
+                'p_value': float(P[i, j]),
+                'original_rows': n,
+                'rows_with_missing': 0,
+                **critical_results,
+                'is_significant': abs(r_value) > critical_results['r_critical']
+            })
+        
+        return results
+    
+    numeric = set(numeric_cols)
+    correlations = []
+    
     # Generate all unique pairs
     for col1, col2 in combinations(numeric_cols, 2):
         try:
-            # Validate and compute
-            is_valid, _ = validate_columns_for_correlation(df, col1, col2)
+            # Validate and compute on the same extracted arrays
+            paired = get_paired_values(df, col1, col2)
+            is_valid, _ = validate_columns_for_correlation(df, col1, col2, paired, numeric)
             if not is_valid:
                 continue
             
-            corr_results = compute_correlation_from_data(df, col1, col2)
-            critical_results = compute_pearson_r_critical(
-                corr_results['sample_size'], 
-                alpha, 
-                test_type
-            )
-            
-            is_significant = abs(corr_results['r_value']) > critical_results['r_critical']
-            
-            results.append({
-                **corr_results,
-                **critical_results,
-                'is_significant': is_significant
-            })
+            correlations.append(compute_correlation_from_data(df, col1, col2, paired))
         
         except Exception:
             continue
     
-    return results
\ No newline at end of file
+    if not correlations:
+        return results
+    
+    # Critical values for every pair's sample size in one vectorized call
+    ns = np.array([c['sample_size'] for c in correlations])
+    dfs, t_crits, r_crits = compute_pearson_r_critical_batch(ns, alpha, test_type)
+    
+    for corr_results, n, dof, t_crit, r_crit in zip(correlations, ns.tolist(), dfs.tolist(), t_crits, r_crits):
+        results.append({
+            **corr_results,
+            'sample_size': n,
+            'alpha': alpha,
+            'test_type': test_type,
+            'degrees_of_freedom': dof,
+            't_critical': t_crit,
+            'r_critical': r_crit,
+            'is_significant': abs(corr_results['r_value']) > r_crit
+        })
+    
+    return results
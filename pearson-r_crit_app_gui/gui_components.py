@@ -3,8 +3,149 @@ GUI Components Module
 Contains reusable CustomTkinter widgets and components.
 """
 
+import os
+import re
+import sys
+import bisect
+import threading
+import tkinter as tk
 import customtkinter as ctk
-from typing import Callable
+from tkinter import filedialog, messagebox
+from typing import Callable, Dict, List, Optional, Tuple
+
+from excel_utils import read_excel_file_cached, get_numeric_columns
+
+
+# Correlation strength labels: |r| below 0.2, 0.4, 0.7 and above
+_STRENGTH_THRESHOLDS = (0.2, 0.4, 0.7)
+_STRENGTH_LABELS = ("Very Weak", "Weak", "Moderate", "Strong")
+
+# Section separators used in the results text
+_SEP_HEAVY = "═" * 45
+_SEP_LIGHT = "─" * 45
+
+# Results text layouts, filled with str.format_map in ResultsDisplay.display_results
+_EXCEL_TEMPLATE = "\n".join([
+    _SEP_HEAVY,
+    "EXCEL FILE CORRELATION ANALYSIS",
+    _SEP_HEAVY,
+    "\n📊 Variables Analyzed:",
+    "   X: {column_1}",
+    "   Y: {column_2}",
+    "\nSample Size (n): {sample_size}{missing_note}",
+    "Significance Level (α): {alpha}",
+    "Test Type: {test_type_title}",
+    "\n" + _SEP_HEAVY,
+    "\n📈 Correlation Results:",
+    "\nPearson's r: {r_value:.6f}",
+    "P-value: {p_value:.6f}",
+    "\n" + _SEP_LIGHT,
+    "\n🎯 Critical Value Analysis:",
+    "\nDegrees of Freedom (df): {degrees_of_freedom}",
+    "t Critical: {t_critical:.6f}",
+    "r Critical: {r_critical:.6f}",
+    "\n|r| = {r_abs:.6f}",
+    "Required: {r_critical:.6f}",
+    "\n" + _SEP_HEAVY,
+    "\n📊 Interpretation:",
+    "\n{significance_interpretation}",
+    "\nCorrelation Strength: {strength} {direction} correlation",
+])
+
+_STANDARD_TEMPLATE = "\n".join([
+    _SEP_HEAVY,
+    "Test Type: {test_type_title}",
+    "Sample Size (n): {sample_size}",
+    "Significance Level (α): {alpha}",
+    _SEP_HEAVY,
+    "\nDegrees of Freedom (df): {degrees_of_freedom}",
+    "\nt Critical: {t_critical:.6f}",
+    "\nr Critical: {r_critical:.6f}",
+    "\n" + _SEP_HEAVY,
+    "\n📊 Interpretation:",
+    "\nFor a correlation to be statistically significant",
+    "at α = {alpha}, the absolute value of r",
+    "must be greater than {r_critical:.4f}",
+])
+
+# Section heading lines of the templates, rendered with the "heading" tag
+_HEADINGS = frozenset({
+    "EXCEL FILE CORRELATION ANALYSIS",
+    "📊 Variables Analyzed:",
+    "📈 Correlation Results:",
+    "🎯 Critical Value Analysis:",
+    "📊 Interpretation:",
+})
+
+
+def _tag_pieces(text: str, highlight: Optional[str] = None) -> List[Tuple[str, str]]:
+    """
+    Split rendered results text into (chunk, tag) pieces for tk.Text.insert.
+    
+    Heading lines get the "heading" tag, the highlight line (if any) the
+    "significant" tag and everything else "body"; consecutive lines with the
+    same tag are merged so the joined chunks equal the original text.
+    """
+    groups = []
+    for line in text.split("\n"):
+        if line in _HEADINGS:
+            tag = "heading"
+        elif highlight is not None and line == highlight:
+            tag = "significant"
+        else:
+            tag = "body"
+        
+        if groups and groups[-1][1] == tag:
+            groups[-1][0].append(line)
+        else:
+            groups.append(([line], tag))
+    
+    last = len(groups) - 1
+    return [("\n".join(lines) + ("" if i == last else "\n"), tag)
+            for i, (lines, tag) in enumerate(groups)]
+
+
+# Characters that must be backslash-escaped in a bare Tcl word
+_TCL_SPECIAL = re.compile(r'[\\{}\[\]$";\s]')
+_TCL_ESCAPES = {"\n": "\\n", "\t": "\\t", "\r": "\\r"}
+
+
+def _tcl_quote(text: str) -> str:
+    """Quote text as a single Tcl word so it can be embedded in a tk.eval script."""
+    if not text:
+        # An empty string would otherwise vanish from the script instead of
+        # being passed as an (empty) argument
+        return "{}"
+    return _TCL_SPECIAL.sub(lambda m: _TCL_ESCAPES.get(m.group(), "\\" + m.group()), text)
+
+
+# Shared fonts, keyed by (size, weight)
+_FONTS: Dict[Tuple[int, str], ctk.CTkFont] = {}
+
+
+def get_font(size: int, weight: str = "normal") -> ctk.CTkFont:
+    """
+    Return a shared CTkFont for the given size and weight.
+    
+    Fonts are created on first request (a Tk root must exist by then) and
+    reused by every widget afterwards instead of building a new font each time.
+    
+    Parameters:
+    -----------
+    size : int
+        Font size
+    weight : str
+        Either "normal" or "bold" (default: "normal")
+        
+    Returns:
+    --------
+    CTkFont : Cached font instance
+    """
+    key = (size, weight)
+    font = _FONTS.get(key)
+    if font is None:
+        font = _FONTS[key] = ctk.CTkFont(size=size, weight=weight)
+    return font
 
 
 class LabeledEntry(ctk.CTkFrame):
@@ -12,6 +153,9 @@ class LabeledEntry(ctk.CTkFrame):
     A reusable frame containing a label and entry widget.
     """
     
+    # Placeholder text per label, shared by all instances
+    _PLACEHOLDER_CACHE: Dict[str, str] = {}
+    
     def __init__(self, master, label_text: str, default_value: str = "", 
                  **kwargs):
         """
@@ -35,30 +179,65 @@ class LabeledEntry(ctk.CTkFrame):
         self.label = ctk.CTkLabel(
             self, 
             text=label_text,
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=get_font(14, "bold")
         )
         self.label.grid(row=0, column=0, sticky="w", padx=5, pady=(0, 5))
         
         # Create entry
+        placeholder = LabeledEntry._PLACEHOLDER_CACHE.get(label_text)
+        if placeholder is None:
+            placeholder = LabeledEntry._PLACEHOLDER_CACHE[label_text] = f"Enter {label_text.lower()}"
+        
         self.entry = ctk.CTkEntry(
             self,
-            placeholder_text=f"Enter {label_text.lower()}",
-            font=ctk.CTkFont(size=13)
+            placeholder_text=placeholder,
+            font=get_font(13)
         )
         self.entry.grid(row=1, column=0, sticky="ew", padx=5, pady=(0, 10))
         
         # Set default value if provided
         if default_value:
             self.entry.insert(0, default_value)
+        
+        # Last successfully parsed (text, value) for get_float
+        self._parsed_text = None
+        self._parsed_value = None
     
     def get(self) -> str:
         """Get the current value of the entry."""
         return self.entry.get()
     
+    def get_float(self) -> Optional[float]:
+        """
+        Get the entry value as a float.
+        
+        The parsed value is reused while the text is unchanged.
+        
+        Returns:
+        --------
+        float or None : Parsed value, or None if the text is not a number
+        """
+        text = self.entry.get()
+        if text != self._parsed_text:
+            try:
+                value = float(text)
+            except ValueError:
+                return None
+            self._parsed_text, self._parsed_value = text, value
+        return self._parsed_value
+    
+    def get_int(self) -> Optional[int]:
+        """Get the entry value truncated to an int (None if the text is not a number)."""
+        value = self.get_float()
+        return None if value is None else int(value)
+    
     def set(self, value: str):
         """Set the value of the entry."""
-        self.entry.delete(0, 'end')
-        self.entry.insert(0, value)
+        # Drop the placeholder first (as CTkEntry.insert would), then replace
+        # the text with one Tcl script instead of separate delete/insert calls
+        self.entry._deactivate_placeholder()
+        w = str(self.entry._entry)
+        self.entry.tk.eval(f"{w} delete 0 end; {w} insert 0 {_tcl_quote(str(value))}")
     
     def clear(self):
         """Clear the entry field."""
@@ -70,6 +249,12 @@ class ExcelAnalysisFrame(ctk.CTkFrame):
     A frame for Excel file analysis controls.
     """
     
+    # Delay (ms) used to coalesce repeated file loads into one UI update
+    UI_UPDATE_DELAY_MS = 75
+    
+    # Maximum number of columns listed in a dropdown at once
+    MAX_DROPDOWN_VALUES = 50
+    
     def __init__(self, master, on_analyze_callback, **kwargs):
         """
         Initialize Excel analysis frame.
@@ -92,7 +277,7 @@ class ExcelAnalysisFrame(ctk.CTkFrame):
         title_label = ctk.CTkLabel(
             self,
             text="📊 Excel File Analysis",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=get_font(16, "bold")
         )
         title_label.grid(row=0, column=0, padx=15, pady=(15, 10), sticky="w")
         
@@ -100,7 +285,7 @@ class ExcelAnalysisFrame(ctk.CTkFrame):
         self.filepath_label = ctk.CTkLabel(
             self,
             text="No file selected",
-            font=ctk.CTkFont(size=11),
+            font=get_font(11),
             text_color="gray50",
             anchor="w"
         )
@@ -116,7 +301,7 @@ class ExcelAnalysisFrame(ctk.CTkFrame):
             button_frame,
             text="Browse Excel File",
             command=self.browse_file,
-            font=ctk.CTkFont(size=13),
+            font=get_font(13),
             height=35
         )
         self.browse_button.grid(row=0, column=0, padx=(0, 5), sticky="ew")
@@ -126,7 +311,7 @@ class ExcelAnalysisFrame(ctk.CTkFrame):
             button_frame,
             text="Analyze File",
             command=self.analyze_file,
-            font=ctk.CTkFont(size=13),
+            font=get_font(13),
             height=35,
             state="disabled",
             fg_color="green",
@@ -134,117 +319,209 @@ class ExcelAnalysisFrame(ctk.CTkFrame):
         )
         self.analyze_button.grid(row=0, column=1, padx=(5, 0), sticky="ew")
         
-        # Column selection frame (initially hidden)
+        # Column selection frame (built on first successful load)
+        self.column_frame = None
+        
+        # Store current filepath
+        self.current_filepath = None
+        self.numeric_columns = []
+        self._numeric_columns_lower = []
+        
+        # DataFrame of the loaded file (handed to the analysis callback)
+        self._current_df = None
+        
+        # Display names for loaded file paths
+        self._filename_cache: Dict[str, str] = {}
+        
+        # Pending debounced UI update (after() id)
+        self._pending_after_id = None
+    
+    def destroy(self):
+        """Cancel the pending UI update and drop the DataFrame and Tk variables."""
+        if self._pending_after_id is not None:
+            self.after_cancel(self._pending_after_id)
+            self._pending_after_id = None
+        
+        # Variables exist only once the column frame was built (and only
+        # until the first destroy call)
+        if getattr(self, "col1_var", None) is not None:
+            self.col1_var.set("")
+            self.col2_var.set("")
+            del self.col1_var
+            del self.col2_var
+        
+        self._current_df = None
+        super().destroy()
+    
+    def browse_file(self):
+        """Open file dialog to select Excel file."""
+        filepath = filedialog.askopenfilename(
+            title="Select Excel File",
+            filetypes=[
+                ("Excel Files", "*.xlsx *.xls"),
+                ("All Files", "*.*")
+            ]
+        )
+        
+        if filepath:
+            self.load_file(filepath)
+    
+    def load_file(self, filepath):
+        """Load Excel file in a background thread and extract numeric columns."""
+        self.browse_button.configure(state="disabled", text="Loading…")
+        
+        thread = threading.Thread(target=self._parse_worker, args=(filepath,))
+        thread.daemon = True
+        thread.start()
+    
+    def _parse_worker(self, filepath):
+        """Parse the workbook off the Tk main loop and post the result back with after()."""
+        try:
+            success, df, error = read_excel_file_cached(filepath, engine="calamine", read_only=True)
+            numeric_columns = get_numeric_columns(df) if success else []
+        except Exception as e:
+            success, df, error = False, None, f"Error reading Excel file: {str(e)}"
+            numeric_columns = []
+        
+        self.after(0, self._on_parse_done, filepath, success, df, error, numeric_columns)
+    
+    def _on_parse_done(self, filepath, success, df, error, numeric_columns):
+        """Handle a finished parse on the main thread."""
+        self.browse_button.configure(state="normal", text="Browse Excel File")
+        
+        if not success:
+            messagebox.showerror("File Error", error)
+            return
+        
+        # Reject the file before touching any state, so the previously
+        # loaded file (and its column list) stays usable
+        if len(numeric_columns) < 2:
+            messagebox.showerror(
+                "Invalid File",
+                "The Excel file must contain at least 2 numeric columns for correlation analysis."
+            )
+            return
+        
+        # Coalesce back-to-back loads into a single widget reconfigure
+        if self._pending_after_id is not None:
+            self.after_cancel(self._pending_after_id)
+        self._pending_after_id = self.after(
+            self.UI_UPDATE_DELAY_MS, self._apply_ui_update, filepath, df, numeric_columns
+        )
+    
+    def _ensure_column_frame(self):
+        """Build and show the column selection widgets the first time they are needed."""
+        if self.column_frame is not None:
+            return
+        
         self.column_frame = ctk.CTkFrame(self)
         self.column_frame.grid(row=3, column=0, padx=15, pady=(0, 15), sticky="ew")
         self.column_frame.grid_columnconfigure(0, weight=1)
-        self.column_frame.grid_remove()  # Hide initially
         
         # Column 1 selection
         col1_label = ctk.CTkLabel(
             self.column_frame,
             text="Column 1 (X):",
-            font=ctk.CTkFont(size=12, weight="bold")
+            font=get_font(12, "bold")
         )
         col1_label.grid(row=0, column=0, padx=10, pady=(10, 5), sticky="w")
         
         self.col1_var = ctk.StringVar(value="")
-        self.col1_menu = ctk.CTkOptionMenu(
+        self.col1_menu = ctk.CTkComboBox(
             self.column_frame,
             variable=self.col1_var,
-            values=["No columns available"],
-            font=ctk.CTkFont(size=12)
+            values=(),
+            font=get_font(12)
         )
+        self.col1_menu.bind("<KeyRelease>", self._filter_columns)
         self.col1_menu.grid(row=1, column=0, padx=10, pady=(0, 10), sticky="ew")
         
         # Column 2 selection
         col2_label = ctk.CTkLabel(
             self.column_frame,
             text="Column 2 (Y):",
-            font=ctk.CTkFont(size=12, weight="bold")
+            font=get_font(12, "bold")
         )
         col2_label.grid(row=2, column=0, padx=10, pady=(0, 5), sticky="w")
         
         self.col2_var = ctk.StringVar(value="")
-        self.col2_menu = ctk.CTkOptionMenu(
+        self.col2_menu = ctk.CTkComboBox(
             self.column_frame,
             variable=self.col2_var,
-            values=["No columns available"],
-            font=ctk.CTkFont(size=12)
+            values=(),
+            font=get_font(12)
         )
+        self.col2_menu.bind("<KeyRelease>", self._filter_columns)
         self.col2_menu.grid(row=3, column=0, padx=10, pady=(0, 10), sticky="ew")
-        
-        # Store current filepath
-        self.current_filepath = None
-        self.numeric_columns = []
     
-    def browse_file(self):
-        """Open file dialog to select Excel file."""
-        from tkinter import filedialog
-        
-        filepath = filedialog.askopenfilename(
-            title="Select Excel File",
-            filetypes=[
-                ("Excel Files", "*.xlsx *.xls"),
-                ("All Files", "*.*")
-            ]
-        )
-        
-        if filepath:
-            self.load_file(filepath)
-    
-    def load_file(self, filepath):
-        """Load Excel file and extract numeric columns."""
-        from excel_utils import read_excel_file, get_numeric_columns
-        
-        success, df, error = read_excel_file(filepath)
-        
-        if not success:
-            from tkinter import messagebox
-            messagebox.showerror("File Error", error)
-            return
-        
-        # Get numeric columns
-        self.numeric_columns = get_numeric_columns(df)
+    def _apply_ui_update(self, filepath, df, numeric_columns):
+        """Apply the results of the latest load_file call to the widgets."""
+        self._pending_after_id = None
         
-        if len(self.numeric_columns) < 2:
-            from tkinter import messagebox
-            messagebox.showerror(
-                "Invalid File",
-                "The Excel file must contain at least 2 numeric columns for correlation analysis."
-            )
-            return
+        # Switch every piece of per-file state at once, so analyze_file never
+        # sees the new file's columns with the old file's path or DataFrame
+        self.current_filepath = filepath
+        self._current_df = df
+        self.numeric_columns = numeric_columns
+        self._numeric_columns_lower = [str(c).lower() for c in numeric_columns]
         
         # Update UI
-        self.current_filepath = filepath
-        filename = filepath.split('/')[-1].split('\\')[-1]
+        filename = self._filename_cache.get(filepath)
+        if filename is None:
+            filename = self._filename_cache[filepath] = os.path.basename(filepath)
         self.filepath_label.configure(text=f"File: {filename}")
         
-        # Update column dropdowns
-        self.col1_menu.configure(values=self.numeric_columns)
-        self.col2_menu.configure(values=self.numeric_columns)
-        self.col1_var.set(self.numeric_columns[0])
-        self.col2_var.set(self.numeric_columns[1] if len(self.numeric_columns) > 1 else self.numeric_columns[0])
-        
-        # Show column selection and enable analyze button
-        self.column_frame.grid()
+        # Update column dropdowns (wide sheets are narrowed by typing)
+        self._ensure_column_frame()
+        values = tuple(numeric_columns[:self.MAX_DROPDOWN_VALUES])
+        self.col1_menu.configure(values=values)
+        self.col2_menu.configure(values=values)
+        
+        # Only write the variables when the selection actually changes
+        new_col1 = sys.intern(str(numeric_columns[0]))
+        new_col2 = sys.intern(str(numeric_columns[1] if len(numeric_columns) > 1 else numeric_columns[0]))
+        if self.col1_var.get() != new_col1:
+            self.col1_var.set(new_col1)
+        if self.col2_var.get() != new_col2:
+            self.col2_var.set(new_col2)
+        
+        # Enable analyze button
         self.analyze_button.configure(state="normal")
     
+    def _filter_columns(self, event):
+        """Narrow the dropdown that received the key press to matching columns."""
+        if len(self.numeric_columns) <= self.MAX_DROPDOWN_VALUES:
+            return
+        
+        menu = self.col1_menu if event.widget is self.col1_menu._entry else self.col2_menu
+        query = menu.get().lower()
+        matches = [
+            col for col, lower in zip(self.numeric_columns, self._numeric_columns_lower)
+            if query in lower
+        ]
+        menu.configure(values=tuple(matches[:self.MAX_DROPDOWN_VALUES]))
+    
     def analyze_file(self):
         """Trigger analysis callback."""
         if self.current_filepath and self.on_analyze_callback:
             col1 = self.col1_var.get()
             col2 = self.col2_var.get()
             
+            if col1 not in self.numeric_columns or col2 not in self.numeric_columns:
+                messagebox.showerror(
+                    "Invalid Selection",
+                    "Please select columns from the list of numeric columns."
+                )
+                return
+            
             if col1 == col2:
-                from tkinter import messagebox
                 messagebox.showerror(
                     "Invalid Selection",
                     "Please select two different columns for correlation analysis."
                 )
                 return
             
-            self.on_analyze_callback(self.current_filepath, col1, col2)
+            self.on_analyze_callback(self.current_filepath, col1, col2, df=self._current_df)
 
 
 class ResultsDisplay(ctk.CTkFrame):
@@ -273,22 +550,65 @@ class ResultsDisplay(ctk.CTkFrame):
         self.title_label = ctk.CTkLabel(
             self,
             text="Results",
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=get_font(18, "bold")
         )
-        self.title_label.grid(row=0, column=0, padx=20, pady=(15, 10))
+        self.title_label.grid(row=0, column=0, columnspan=2, padx=20, pady=(15, 10))
         
-        # Results text widget (using CTkTextbox for better formatting)
-        self.results_text = ctk.CTkTextbox(
+        # Results text widget (built on first display_results call)
+        self.results_text = None
+    
+    def _ensure_textbox(self):
+        """Create the results textbox the first time there is something to show."""
+        if self.results_text is not None:
+            return
+        
+        # Results text widget (plain tk.Text styled like a CTkTextbox)
+        self.results_text = tk.Text(
             self,
-            font=ctk.CTkFont(size=13),
-            height=450,
-            wrap="word"
+            height=25,
+            wrap="word",
+            relief="flat",
+            bd=0,
+            highlightthickness=0,
+            padx=6,
+            pady=6
         )
-        self.results_text.grid(row=1, column=0, padx=20, pady=(0, 15), sticky="nsew")
+        self._style_textbox()
+        self.results_text.grid(row=1, column=0, padx=(20, 0), pady=(0, 15), sticky="nsew")
+        
+        scrollbar = ctk.CTkScrollbar(self, command=self.results_text.yview)
+        scrollbar.grid(row=1, column=1, padx=(0, 20), pady=(0, 15), sticky="ns")
+        self.results_text.configure(yscrollcommand=scrollbar.set)
+        
+        # Tags used by the chunked insert in _set_text (heading font is set
+        # in _style_textbox)
+        self.results_text.tag_configure("significant", foreground="#2FA572")
         
         # Initially disable editing
         self.results_text.configure(state="disabled")
     
+    def _style_textbox(self):
+        """Apply the CTkTextbox theme colors and the scaled fonts to the results text."""
+        theme = ctk.ThemeManager.theme["CTkTextbox"]
+        self.results_text.configure(
+            font=self._apply_font_scaling(get_font(13)),
+            bg=self._apply_appearance_mode(theme["fg_color"]),
+            fg=self._apply_appearance_mode(theme["text_color"])
+        )
+        self.results_text.tag_configure("heading", font=self._apply_font_scaling(get_font(14, "bold")))
+    
+    def _set_appearance_mode(self, mode_string):
+        # tk.Text is not a CTk widget, so follow set_appearance_mode here
+        super()._set_appearance_mode(mode_string)
+        if self.results_text is not None:
+            self._style_textbox()
+    
+    def _set_scaling(self, new_widget_scaling, new_window_scaling):
+        # Likewise for set_widget_scaling and DPI changes
+        super()._set_scaling(new_widget_scaling, new_window_scaling)
+        if self.results_text is not None:
+            self._style_textbox()
+    
     def display_results(self, results_dict: dict):
         """
         Display formatted results in the text widget.
@@ -298,78 +618,48 @@ class ResultsDisplay(ctk.CTkFrame):
         results_dict : dict
             Dictionary containing computation results
         """
-        # Enable editing to update text
-        self.results_text.configure(state="normal")
-        self.results_text.delete("1.0", "end")
-        
-        # Format and insert results
-        output = []
-        output.append("═" * 45)
-        
-        # Check if this is an Excel analysis (has column names and r_value)
+        # Format results
         if 'column_1' in results_dict and 'r_value' in results_dict:
-            output.append("EXCEL FILE CORRELATION ANALYSIS")
-            output.append("═" * 45)
-            output.append(f"\n📊 Variables Analyzed:")
-            output.append(f"   X: {results_dict['column_1']}")
-            output.append(f"   Y: {results_dict['column_2']}")
-            output.append(f"\nSample Size (n): {results_dict['sample_size']}")
-            if results_dict.get('rows_with_missing', 0) > 0:
-                output.append(f"   (Original rows: {results_dict['original_rows']}, "
-                            f"Excluded {results_dict['rows_with_missing']} with missing data)")
-            output.append(f"Significance Level (α): {results_dict['alpha']}")
-            output.append(f"Test Type: {results_dict['test_type'].title()}")
-            output.append("\n" + "═" * 45)
-            output.append("\n📈 Correlation Results:")
-            output.append(f"\nPearson's r: {results_dict['r_value']:.6f}")
-            output.append(f"P-value: {results_dict['p_value']:.6f}")
-            output.append(f"\n" + "─" * 45)
-            output.append("\n🎯 Critical Value Analysis:")
-            output.append(f"\nDegrees of Freedom (df): {results_dict['degrees_of_freedom']}")
-            output.append(f"t Critical: {results_dict['t_critical']:.6f}")
-            output.append(f"r Critical: {results_dict['r_critical']:.6f}")
-            output.append(f"\n|r| = {abs(results_dict['r_value']):.6f}")
-            output.append(f"Required: {results_dict['r_critical']:.6f}")
-            output.append("\n" + "═" * 45)
-            output.append("\n📊 Interpretation:")
-            output.append(f"\n{results_dict['significance_interpretation']}")
-            
-            # Add strength interpretation
+            # Excel analysis (has column names and r_value)
             r_abs = abs(results_dict['r_value'])
-            if r_abs >= 0.7:
-                strength = "Strong"
-            elif r_abs >= 0.4:
-                strength = "Moderate"
-            elif r_abs >= 0.2:
-                strength = "Weak"
-            else:
-                strength = "Very Weak"
-            
-            direction = "positive" if results_dict['r_value'] > 0 else "negative"
-            output.append(f"\nCorrelation Strength: {strength} {direction} correlation")
-        
+            missing = results_dict.get('rows_with_missing', 0)
+            text = _EXCEL_TEMPLATE.format_map({
+                **results_dict,
+                'test_type_title': results_dict['test_type'].title(),
+                'missing_note': (
+                    f"\n   (Original rows: {results_dict['original_rows']}, "
+                    f"Excluded {missing} with missing data)" if missing > 0 else ""
+                ),
+                'r_abs': r_abs,
+                'strength': _STRENGTH_LABELS[bisect.bisect_right(_STRENGTH_THRESHOLDS, r_abs)],
+                'direction': "positive" if results_dict['r_value'] > 0 else "negative",
+            })
         else:
             # Standard critical value display
-            output.append(f"Test Type: {results_dict['test_type'].title()}")
-            output.append(f"Sample Size (n): {results_dict['sample_size']}")
-            output.append(f"Significance Level (α): {results_dict['alpha']}")
-            output.append("═" * 45)
-            output.append(f"\nDegrees of Freedom (df): {results_dict['degrees_of_freedom']}")
-            output.append(f"\nt Critical: {results_dict['t_critical']:.6f}")
-            output.append(f"\nr Critical: {results_dict['r_critical']:.6f}")
-            output.append("\n" + "═" * 45)
-            output.append("\n📊 Interpretation:")
-            output.append(f"\nFor a correlation to be statistically significant")
-            output.append(f"at α = {results_dict['alpha']}, the absolute value of r")
-            output.append(f"must be greater than {results_dict['r_critical']:.4f}")
-        
-        self.results_text.insert("1.0", "\n".join(output))
-        
-        # Disable editing again
-        self.results_text.configure(state="disabled")
+            text = _STANDARD_TEMPLATE.format_map({
+                **results_dict,
+                'test_type_title': results_dict['test_type'].title(),
+            })
+        
+        # Highlight the interpretation line when the correlation is significant
+        highlight = (results_dict['significance_interpretation']
+                     if results_dict.get('is_significant') else None)
+        
+        self._ensure_textbox()
+        self._set_text(_tag_pieces(text, highlight))
     
     def clear(self):
         """Clear the results display."""
-        self.results_text.configure(state="normal")
-        self.results_text.delete("1.0", "end")
-        self.results_text.configure(state="disabled")
\ No newline at end of file
+        if self.results_text is None:
+            return
+        self._set_text([])
+    
+    def _set_text(self, pieces: List[Tuple[str, str]]):
+        """Replace the read-only text with tagged (chunk, tag) pieces in a single Tcl round trip."""
+        w = str(self.results_text)
+        script = f"{w} configure -state normal; {w} delete 1.0 end; "
+        # Empty chunks insert nothing; leave them out rather than pass {} words
+        words = " ".join(f"{_tcl_quote(chunk)} {tag}" for chunk, tag in pieces if chunk)
+        if words:
+            script += f"{w} insert 1.0 {words}; "
+        self.results_text.tk.eval(script + f"{w} configure -state disabled")
\ No newline at end of file
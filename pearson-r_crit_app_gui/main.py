@@ -8,18 +8,14 @@ from tkinter import messagebox
 import threading
 from datetime import datetime
 from pathlib import Path
-from docx import Document
-from docx.shared import Pt, RGBColor, Inches
-from docx.enum.text import WD_ALIGN_PARAGRAPH
 
 # Import custom modules
 from stats_utils import (
     validate_sample_size,
     validate_alpha,
-    compute_pearson_r_critical,
-    format_results
+    compute_pearson_r_critical
 )
-from gui_components import LabeledEntry, ResultsDisplay, ExcelAnalysisFrame
+from gui_components import LabeledEntry, ResultsDisplay, ExcelAnalysisFrame, get_font
 from excel_utils import analyze_excel_correlation
 
 
@@ -88,14 +84,14 @@ class PearsonCalculatorApp(ctk.CTk):
         title_label = ctk.CTkLabel(
             header_frame,
             text="Pearson's r Critical Value Calculator",
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=get_font(24, "bold")
         )
         title_label.pack(pady=(0, 5))
         
         subtitle_label = ctk.CTkLabel(
             header_frame,
             text="Manual Calculation & Automated Excel Analysis",
-            font=ctk.CTkFont(size=13),
+            font=get_font(13),
             text_color="gray50"
         )
         subtitle_label.pack()
@@ -161,7 +157,7 @@ class PearsonCalculatorApp(ctk.CTk):
         test_type_label = ctk.CTkLabel(
             test_type_frame,
             text="Test Type:",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=get_font(14, "bold")
         )
         test_type_label.pack(anchor="w", padx=5, pady=(0, 5))
         
@@ -171,7 +167,7 @@ class PearsonCalculatorApp(ctk.CTk):
             test_type_frame,
             variable=self.test_type_var,
             values=["two-tailed", "one-tailed"],
-            font=ctk.CTkFont(size=13)
+            font=get_font(13)
         )
         test_type_menu.pack(fill="x", padx=5)
         
@@ -185,7 +181,7 @@ class PearsonCalculatorApp(ctk.CTk):
             button_frame,
             text="Compute Critical Value",
             command=self.on_calculate_click,
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=get_font(14, "bold"),
             height=40
         )
         self.calculate_button.grid(row=0, column=0, padx=(0, 5), sticky="ew")
@@ -195,7 +191,7 @@ class PearsonCalculatorApp(ctk.CTk):
             button_frame,
             text="Save Results",
             command=self.save_results,
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=get_font(14, "bold"),
             height=40,
             fg_color="gray60",
             hover_color="gray50"
@@ -209,7 +205,7 @@ class PearsonCalculatorApp(ctk.CTk):
         formula_label = ctk.CTkLabel(
             footer_frame,
             text="Formula: r = √(t² / (t² + df))  |  df = n - 2",
-            font=ctk.CTkFont(size=11),
+            font=get_font(11),
             text_color="gray50"
         )
         formula_label.pack()
@@ -249,7 +245,7 @@ class PearsonCalculatorApp(ctk.CTk):
         params_title = ctk.CTkLabel(
             params_frame,
             text="Analysis Parameters",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=get_font(16, "bold")
         )
         params_title.grid(row=0, column=0, padx=15, pady=(15, 10), sticky="w")
         
@@ -268,7 +264,7 @@ class PearsonCalculatorApp(ctk.CTk):
         test_type_label = ctk.CTkLabel(
             test_type_frame,
             text="Test Type:",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=get_font(14, "bold")
         )
         test_type_label.pack(anchor="w", padx=5, pady=(0, 5))
         
@@ -278,7 +274,7 @@ class PearsonCalculatorApp(ctk.CTk):
             test_type_frame,
             variable=self.excel_test_type_var,
             values=["two-tailed", "one-tailed"],
-            font=ctk.CTkFont(size=13)
+            font=get_font(13)
         )
         test_type_menu.pack(fill="x", padx=5)
         
@@ -300,63 +296,53 @@ class PearsonCalculatorApp(ctk.CTk):
         --------
         bool : True if all inputs are valid, False otherwise
         """
+        # Parse each entry once (None if not a number; the validators report it)
+        n = self.sample_size_entry.get_float()
+        alpha = self.alpha_entry.get_float()
+        
         # Validate sample size
-        is_valid, error_msg = validate_sample_size(self.sample_size_entry.get())
+        is_valid, error_msg = validate_sample_size(n)
         if not is_valid:
             messagebox.showerror("Input Error", error_msg)
             return False
         
         # Validate alpha
-        is_valid, error_msg = validate_alpha(self.alpha_entry.get())
+        is_valid, error_msg = validate_alpha(alpha)
         if not is_valid:
             messagebox.showerror("Input Error", error_msg)
             return False
         
+        # Keep the parsed values for the calculation
+        self._parsed = (int(n), alpha)
         return True
     
-    def calculate_in_thread(self):
-        """
-        Perform calculation in a separate thread to avoid UI freezing.
-        This ensures the GUI remains responsive during computation.
-        """
+    def on_calculate_click(self):
+        """Handle calculate button click event."""
+        # Validate inputs first
+        if not self.validate_inputs():
+            return
+        
+        # The computation is a single stdtrit + sqrt, so it runs inline;
+        # a worker thread would cost more than the calculation itself
         try:
-            # Get input values
-            n = int(float(self.sample_size_entry.get()))
-            alpha = float(self.alpha_entry.get())
+            # Get input values (parsed during validation)
+            n, alpha = self._parsed
             test_type = self.test_type_var.get()
             
             # Compute results
             results = compute_pearson_r_critical(n, alpha, test_type)
             
-            # Store results for saving
-            self.current_results = results
-            
-            # Update GUI in main thread
-            self.after(0, lambda: self.display_results(results))
-            
         except Exception as e:
-            # Show error in main thread
-            self.after(0, lambda: messagebox.showerror(
+            messagebox.showerror(
                 "Calculation Error",
                 f"An error occurred during calculation:\n{str(e)}"
-            ))
-        finally:
-            # Re-enable button in main thread
-            self.after(0, lambda: self.calculate_button.configure(state="normal"))
-    
-    def on_calculate_click(self):
-        """Handle calculate button click event."""
-        # Validate inputs first
-        if not self.validate_inputs():
+            )
             return
         
-        # Disable button to prevent multiple clicks
-        self.calculate_button.configure(state="disabled")
+        # Store results for saving
+        self.current_results = results
         
-        # Run calculation in separate thread
-        calc_thread = threading.Thread(target=self.calculate_in_thread)
-        calc_thread.daemon = True
-        calc_thread.start()
+        self.display_results(results)
     
     def display_results(self, results: dict):
         """
@@ -370,14 +356,15 @@ class PearsonCalculatorApp(ctk.CTk):
         self.results_display.display_results(results)
         
         # Show success message
+        r_crit = results['r_critical']
         messagebox.showinfo(
             "Calculation Complete",
-            f"r Critical = {results['r_critical']:.6f}\n\n"
+            f"r Critical = {r_crit:.6f}\n\n"
             f"For significance at α = {results['alpha']}, "
-            f"|r| must exceed {results['r_critical']:.4f}"
+            f"|r| must exceed {r_crit:.4f}"
         )
     
-    def analyze_excel_file(self, filepath: str, col1: str, col2: str):
+    def analyze_excel_file(self, filepath: str, col1: str, col2: str, df=None):
         """
         Analyze Excel file and display correlation results.
         
@@ -387,6 +374,8 @@ class PearsonCalculatorApp(ctk.CTk):
             Path to Excel file
         col1, col2 : str
             Column names to correlate
+        df : pd.DataFrame, optional
+            Already parsed contents of the file (skips re-reading it)
         """
         # Disable analyze button
         self.excel_frame.analyze_button.configure(state="disabled")
@@ -406,7 +395,7 @@ class PearsonCalculatorApp(ctk.CTk):
                 
                 # Analyze file
                 success, results, error = analyze_excel_correlation(
-                    filepath, col1, col2, alpha, test_type
+                    filepath, col1, col2, alpha, test_type, df=df
                 )
                 
                 if not success:
@@ -437,19 +426,21 @@ class PearsonCalculatorApp(ctk.CTk):
         
         # Show summary message
         sig_text = "SIGNIFICANT" if results['is_significant'] else "NOT SIGNIFICANT"
+        r_value = results['r_value']
         messagebox.showinfo(
             "Analysis Complete",
             f"Correlation between:\n"
             f"  {results['column_1']} and {results['column_2']}\n\n"
-            f"Pearson's r = {results['r_value']:.6f}\n"
+            f"Pearson's r = {r_value:.6f}\n"
             f"P-value = {results['p_value']:.6f}\n\n"
             f"Result: {sig_text}\n"
-            f"(|r| = {abs(results['r_value']):.4f} vs threshold {results['r_critical']:.4f})"
+            f"(|r| = {abs(r_value):.4f} vs threshold {results['r_critical']:.4f})"
         )
     
     def save_results(self):
-        """Save current results to a Word document (.docx) with file dialog."""
-        if self.current_results is None:
+        """Save current results to a Word document (.docx) or Excel workbook (.xlsx) with file dialog."""
+        results = self.current_results
+        if results is None:
             messagebox.showwarning(
                 "No Results",
                 "Please calculate results before saving."
@@ -459,8 +450,11 @@ class PearsonCalculatorApp(ctk.CTk):
         try:
             from tkinter import filedialog
             
+            # One clock read serves both the filename and the document stamp
+            now = datetime.now()
+            
             # Create default filename with timestamp
-            timestamp = datetime.now().strftime("%m-%d-%Y_%I-%M%p")
+            timestamp = now.strftime("%m-%d-%Y_%I-%M%p")
             default_filename = f"pearson_r_results_{timestamp}.docx"
             
             # Open file dialog for user to choose location and filename
@@ -468,6 +462,7 @@ class PearsonCalculatorApp(ctk.CTk):
                 defaultextension=".docx",
                 filetypes=[
                     ("Word Documents", "*.docx"),
+                    ("Excel Workbooks", "*.xlsx"),
                     ("All Files", "*.*")
                 ],
                 initialfile=default_filename,
@@ -478,33 +473,40 @@ class PearsonCalculatorApp(ctk.CTk):
             if not filepath:
                 return
             
-            # Create document
-            doc = Document()
-            
-            # Add title
-            title = doc.add_heading("Pearson's r Critical Value Analysis", 0)
-            title.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            
-            # Add timestamp
-            timestamp_para = doc.add_paragraph()
-            timestamp_run = timestamp_para.add_run(
-                f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-            )
-            timestamp_run.italic = True
-            timestamp_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            
-            doc.add_paragraph()
-            
-            # Check if Excel analysis
-            is_excel = 'column_1' in self.current_results and 'r_value' in self.current_results
-            
-            if is_excel:
-                self.save_excel_results_to_doc(doc)
+            if filepath.lower().endswith(".xlsx"):
+                self.save_results_xlsx(filepath)
             else:
-                self.save_manual_results_to_doc(doc)
-            
-            # Save document
-            doc.save(filepath)
+                # Imported here so python-docx only loads when a document is saved
+                from docx import Document
+                from docx.enum.text import WD_ALIGN_PARAGRAPH
+                
+                # Create document
+                doc = Document()
+                
+                # Add title
+                title = doc.add_heading("Pearson's r Critical Value Analysis", 0)
+                title.alignment = WD_ALIGN_PARAGRAPH.CENTER
+                
+                # Add timestamp
+                timestamp_para = doc.add_paragraph()
+                timestamp_run = timestamp_para.add_run(
+                    f"Generated: {now.strftime('%Y-%m-%d %H:%M:%S')}"
+                )
+                timestamp_run.italic = True
+                timestamp_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+                
+                doc.add_paragraph()
+                
+                # Check if Excel analysis
+                is_excel = 'column_1' in results and 'r_value' in results
+                
+                if is_excel:
+                    self.save_excel_results_to_doc(doc)
+                else:
+                    self.save_manual_results_to_doc(doc)
+                
+                # Save document
+                doc.save(filepath)
             
             messagebox.showinfo(
                 "Save Successful",
@@ -517,30 +519,89 @@ class PearsonCalculatorApp(ctk.CTk):
                 f"Failed to save results:\n{str(e)}"
             )
     
-    def save_manual_results_to_doc(self, doc):
-        """Save manual calculation results to document."""
-        doc.add_heading("Input Parameters", level=1)
+    def save_results_xlsx(self, filepath: str):
+        """
+        Save current results to an Excel workbook.
         
-        input_table = doc.add_table(rows=4, cols=2)
-        input_table.style = 'Light Grid Accent 1'
+        Uses openpyxl write-only mode, which streams rows straight to the file
+        instead of building an in-memory cell model.
         
-        header_cells = input_table.rows[0].cells
-        header_cells[0].text = "Parameter"
-        header_cells[1].text = "Value"
+        Parameters:
+        -----------
+        filepath : str
+            Destination .xlsx path
+        """
+        from openpyxl import Workbook
+        
+        results = self.current_results
+        
+        if 'column_1' in results and 'r_value' in results:
+            rows = [
+                ("X Variable", results['column_1']),
+                ("Y Variable", results['column_2']),
+                ("Pearson's r", float(results['r_value'])),
+                ("P-value", float(results['p_value'])),
+                ("Sample Size (n)", int(results['sample_size'])),
+                ("Significance Level (α)", float(results['alpha'])),
+                ("Test Type", results['test_type'].title()),
+                ("Degrees of Freedom (df)", int(results['degrees_of_freedom'])),
+                ("t Critical", float(results['t_critical'])),
+                ("r Critical", float(results['r_critical'])),
+                ("Result", "SIGNIFICANT" if results['is_significant'] else "NOT SIGNIFICANT"),
+            ]
+        else:
+            rows = [
+                ("Test Type", results['test_type'].title()),
+                ("Sample Size (n)", int(results['sample_size'])),
+                ("Significance Level (α)", float(results['alpha'])),
+                ("Degrees of Freedom (df)", int(results['degrees_of_freedom'])),
+                ("t Critical", float(results['t_critical'])),
+                ("r Critical", float(results['r_critical'])),
+            ]
+        
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Results")
+        ws.append(["Statistic", "Value"])
+        for row in rows:
+            ws.append(row)
+        wb.save(filepath)
+    
+    @staticmethod
+    def _fill_table(table, cells, styles=None):
+        """
+        Write (label, value) pairs into a 2-column table, one run per cell.
         
-        for cell in header_cells:
-            for paragraph in cell.paragraphs:
-                for run in paragraph.runs:
+        styles maps a row index to (bold, size) for that row's runs; other rows are
+        written plain. Each empty cell gets a single run instead of setting cell.text
+        and then walking every paragraph and run to restyle it.
+        """
+        styles = styles or {}
+        for i, (row, texts) in enumerate(zip(table.rows, cells)):
+            bold, size = styles.get(i, (False, None))
+            for cell, text in zip(row.cells, texts):
+                run = cell.paragraphs[0].add_run(text)
+                if bold:
                     run.font.bold = True
+                if size is not None:
+                    run.font.size = size
+    
+    def save_manual_results_to_doc(self, doc):
+        """Save manual calculation results to document."""
+        from docx.shared import Pt
         
-        input_table.rows[1].cells[0].text = "Test Type"
-        input_table.rows[1].cells[1].text = self.current_results['test_type'].title()
+        results = self.current_results
         
-        input_table.rows[2].cells[0].text = "Sample Size (n)"
-        input_table.rows[2].cells[1].text = str(self.current_results['sample_size'])
+        doc.add_heading("Input Parameters", level=1)
         
-        input_table.rows[3].cells[0].text = "Significance Level (α)"
-        input_table.rows[3].cells[1].text = str(self.current_results['alpha'])
+        input_table = doc.add_table(rows=4, cols=2)
+        input_table.style = 'Light Grid Accent 1'
+        
+        self._fill_table(input_table, [
+            ("Parameter", "Value"),
+            ("Test Type", results['test_type'].title()),
+            ("Sample Size (n)", str(results['sample_size'])),
+            ("Significance Level (α)", str(results['alpha'])),
+        ], styles={0: (True, None)})
         
         doc.add_paragraph()
         
@@ -549,42 +610,26 @@ class PearsonCalculatorApp(ctk.CTk):
         results_table = doc.add_table(rows=4, cols=2)
         results_table.style = 'Light Grid Accent 1'
         
-        results_header = results_table.rows[0].cells
-        results_header[0].text = "Statistic"
-        results_header[1].text = "Value"
-        
-        for cell in results_header:
-            for paragraph in cell.paragraphs:
-                for run in paragraph.runs:
-                    run.font.bold = True
-        
-        results_table.rows[1].cells[0].text = "Degrees of Freedom (df)"
-        results_table.rows[1].cells[1].text = str(self.current_results['degrees_of_freedom'])
-        
-        results_table.rows[2].cells[0].text = "t Critical"
-        results_table.rows[2].cells[1].text = f"{self.current_results['t_critical']:.6f}"
-        
-        r_row = results_table.rows[3].cells
-        r_row[0].text = "r Critical"
-        r_row[1].text = f"{self.current_results['r_critical']:.6f}"
-        
-        for cell in r_row:
-            for paragraph in cell.paragraphs:
-                for run in paragraph.runs:
-                    run.font.bold = True
-                    run.font.size = Pt(12)
+        self._fill_table(results_table, [
+            ("Statistic", "Value"),
+            ("Degrees of Freedom (df)", str(results['degrees_of_freedom'])),
+            ("t Critical", f"{results['t_critical']:.6f}"),
+            ("r Critical", f"{results['r_critical']:.6f}"),
+        ], styles={0: (True, None), 3: (True, Pt(12))})
     
     def save_excel_results_to_doc(self, doc):
         """Save Excel analysis results to document."""
+        results = self.current_results
+        
         doc.add_heading("Excel Correlation Analysis", level=1)
         
         # Variables section
         doc.add_heading("Variables Analyzed", level=2)
         var_para = doc.add_paragraph()
         var_para.add_run(f"X Variable: ").bold = True
-        var_para.add_run(f"{self.current_results['column_1']}\n")
+        var_para.add_run(f"{results['column_1']}\n")
         var_para.add_run(f"Y Variable: ").bold = True
-        var_para.add_run(self.current_results['column_2'])
+        var_para.add_run(results['column_2'])
         
         doc.add_paragraph()
         
@@ -594,21 +639,13 @@ class PearsonCalculatorApp(ctk.CTk):
         corr_table = doc.add_table(rows=5, cols=2)
         corr_table.style = 'Light Grid Accent 1'
         
-        header = corr_table.rows[0].cells
-        header[0].text = "Statistic"
-        header[1].text = "Value"
-        
-        corr_table.rows[1].cells[0].text = "Pearson's r"
-        corr_table.rows[1].cells[1].text = f"{self.current_results['r_value']:.6f}"
-        
-        corr_table.rows[2].cells[0].text = "P-value"
-        corr_table.rows[2].cells[1].text = f"{self.current_results['p_value']:.6f}"
-        
-        corr_table.rows[3].cells[0].text = "Sample Size (n)"
-        corr_table.rows[3].cells[1].text = str(self.current_results['sample_size'])
-        
-        corr_table.rows[4].cells[0].text = "Significance Level (α)"
-        corr_table.rows[4].cells[1].text = str(self.current_results['alpha'])
+        self._fill_table(corr_table, [
+            ("Statistic", "Value"),
+            ("Pearson's r", f"{results['r_value']:.6f}"),
+            ("P-value", f"{results['p_value']:.6f}"),
+            ("Sample Size (n)", str(results['sample_size'])),
+            ("Significance Level (α)", str(results['alpha'])),
+        ])
         
         doc.add_paragraph()
         
@@ -616,9 +653,9 @@ class PearsonCalculatorApp(ctk.CTk):
         doc.add_heading("Statistical Significance", level=2)
         
         interp = doc.add_paragraph()
-        sig_text = "SIGNIFICANT" if self.current_results['is_significant'] else "NOT SIGNIFICANT"
+        sig_text = "SIGNIFICANT" if results['is_significant'] else "NOT SIGNIFICANT"
         interp.add_run(f"Result: {sig_text}\n\n").bold = True
-        interp.add_run(self.current_results['significance_interpretation'])
+        interp.add_run(results['significance_interpretation'])
 
 
 def main():
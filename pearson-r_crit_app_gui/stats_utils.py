@@ -3,10 +3,15 @@ Statistical Utilities Module
 Contains reusable functions for statistical computations related to Pearson's r.
 """
 
-from scipy.stats import t
+import math
 import numpy as np
+from functools import lru_cache
 from typing import Dict, Tuple
 
+# Batches smaller than this skip the compiled kernel, whose import and
+# JIT warmup would cost more than the NumPy expression it replaces
+_KERNEL_MIN_BATCH = 1000
+
 
 def validate_sample_size(n: float) -> Tuple[bool, str]:
     """
@@ -75,13 +80,16 @@ def compute_degrees_of_freedom(n: int) -> int:
     return n - 2
 
 
+@lru_cache(maxsize=1024)
 def compute_t_critical(alpha: float, df: int, test_type: str = "two-tailed") -> float:
     """
     Compute the critical t-value for given alpha and degrees of freedom.
     
-    Uses the t-distribution's percent point function (inverse CDF).
+    Uses the inverse Student t CDF (scipy.special.stdtrit), the routine
+    behind t.ppf, without the scipy.stats distribution wrapper.
     For two-tailed test, we use alpha/2 in each tail.
     For one-tailed test, we use alpha in one tail.
+    Results are memoized per (alpha, df, test_type).
     
     Parameters:
     -----------
@@ -96,12 +104,15 @@ def compute_t_critical(alpha: float, df: int, test_type: str = "two-tailed") ->
     --------
     float : Critical t-value
     """
+    # Imported on first use so loading this module doesn't pull in scipy
+    from scipy.special import stdtrit
+    
     if test_type == "two-tailed":
         # For two-tailed, split alpha between both tails
-        t_crit = t.ppf(1 - alpha / 2, df)
+        t_crit = stdtrit(df, 1 - alpha / 2)
     else:
         # For one-tailed, all alpha in one tail
-        t_crit = t.ppf(1 - alpha, df)
+        t_crit = stdtrit(df, 1 - alpha)
     
     return t_crit
 
@@ -138,6 +149,13 @@ def compute_pearson_r_critical(n: int, alpha: float = 0.05,
         - t_critical: Critical t-value
         - r_critical: Critical r-value
     """
+    # Copy so callers can't modify the cached dictionary
+    return dict(_pearson_r_critical_cached(n, alpha, test_type))
+
+
+@lru_cache(maxsize=1024)
+def _pearson_r_critical_cached(n: int, alpha: float, test_type: str) -> Dict:
+    """Memoized body of compute_pearson_r_critical."""
     # Compute degrees of freedom
     df = compute_degrees_of_freedom(n)
     
@@ -148,7 +166,9 @@ def compute_pearson_r_critical(n: int, alpha: float = 0.05,
     # r = sqrt(t² / (t² + df))
     # This formula comes from the relationship between the t-statistic
     # and Pearson's r in hypothesis testing
-    r_crit = np.sqrt(t_crit**2 / (t_crit**2 + df))
+    # (math.sqrt on the scalar; np.sqrt is kept for the batch version)
+    t2 = t_crit * t_crit
+    r_crit = math.sqrt(t2 / (t2 + df))
     
     # Return all results as a dictionary for reusability
     return {
@@ -161,34 +181,41 @@ def compute_pearson_r_critical(n: int, alpha: float = 0.05,
     }
 
 
-def format_results(results: Dict, decimal_places: int = 6) -> str:
+def compute_pearson_r_critical_batch(ns: np.ndarray, alpha: float = 0.05,
+                                     test_type: str = "two-tailed") -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
     """
-    Format results dictionary into a readable string.
+    Vectorized compute_pearson_r_critical for many sample sizes at once.
+    
+    Evaluates stdtrit on the whole array of degrees of freedom in one call,
+    which amortizes the scipy call overhead when many column pairs are
+    tested at the same alpha. Large batches convert t to r with the
+    parallel kernel in _kernels.
     
     Parameters:
     -----------
-    results : dict
-        Results dictionary from compute_pearson_r_critical
-    decimal_places : int
-        Number of decimal places for formatting (default: 6)
+    ns : np.ndarray
+        Sample sizes
+    alpha : float
+        Significance level (default: 0.05)
+    test_type : str
+        Either "two-tailed" or "one-tailed" (default: "two-tailed")
         
     Returns:
     --------
-    str : Formatted results string
+    tuple : (degrees_of_freedom, t_critical, r_critical) arrays
     """
-    output = []
-    output.append("=" * 50)
-    output.append("PEARSON'S R CRITICAL VALUE RESULTS")
-    output.append("=" * 50)
-    output.append(f"Sample Size (n): {results['sample_size']}")
-    output.append(f"Significance Level (α): {results['alpha']}")
-    output.append(f"Test Type: {results['test_type'].title()}")
-    output.append(f"Degrees of Freedom (df): {results['degrees_of_freedom']}")
-    output.append(f"t Critical: {results['t_critical']:.{decimal_places}f}")
-    output.append(f"r Critical: {results['r_critical']:.{decimal_places}f}")
-    output.append("=" * 50)
-    output.append(f"\nInterpretation: For a correlation to be statistically")
-    output.append(f"significant at α = {results['alpha']}, the absolute value")
-    output.append(f"of r must be greater than {results['r_critical']:.4f}")
-    
-    return "\n".join(output)
\ No newline at end of file
+    from scipy.special import stdtrit
+    
+    df = np.asarray(ns) - 2
+    q = 1 - alpha / 2 if test_type == "two-tailed" else 1 - alpha
+    
+    t_crit = stdtrit(df, q)
+    if t_crit.size > _KERNEL_MIN_BATCH:
+        from _kernels import r_from_t
+        r_crit = r_from_t(np.ravel(t_crit), np.ravel(df).astype(np.float64),
+                          np.empty(t_crit.size)).reshape(t_crit.shape)
+    else:
+        t2 = t_crit**2
+        r_crit = np.sqrt(t2 / (t2 + df))
+    
+    return df, t_crit, r_crit
\ No newline at end of file
@@ -0,0 +1,60 @@
+"""
+Tests for the correlation helpers in excel_utils.
+Run from the app folder with: python -m unittest discover tests
+"""
+
+import math
+import os
+import sys
+import unittest
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from excel_utils import compute_correlation_from_data, get_all_correlation_pairs
+
+
+class AllCorrelationPairsTests(unittest.TestCase):
+    """The Gram-matrix (no NaN) and per-pair (NaN) paths must agree."""
+
+    def setUp(self):
+        # With these values the Gram product rounds |r| for (x, b) and (b, c)
+        # to just above 1
+        x = np.array([8.2, 3.3, -13.0, 9.1, 4.5, -5.4, 5.8, 3.6,
+                      2.9, 0.3, 5.5, -7.4, -1.6, -4.8, 6.0, 0.4])
+        self.df = pd.DataFrame({
+            "x": x,
+            "b": 3 * x + 1,
+            "c": -0.7 * x + 0.1,
+            "noise": np.sin(np.arange(x.size)),
+        })
+
+    @staticmethod
+    def _by_pair(results):
+        return {(r["column_1"], r["column_2"]): r for r in results}
+
+    def test_collinear_pair_with_and_without_nan(self):
+        with_nan = self.df.copy()
+        with_nan.loc[0, "noise"] = np.nan
+        gram = self._by_pair(get_all_correlation_pairs(self.df))
+        per_pair = self._by_pair(get_all_correlation_pairs(with_nan))
+        
+        for pair in [("x", "b"), ("x", "c"), ("b", "c")]:
+            with self.subTest(pair=pair):
+                p_gram = gram[pair]["p_value"]
+                p_pair = per_pair[pair]["p_value"]
+                self.assertFalse(math.isnan(p_gram))
+                self.assertAlmostEqual(p_gram, p_pair, places=12)
+                self.assertAlmostEqual(abs(gram[pair]["r_value"]), 1.0, places=12)
+
+    def test_matches_single_pair(self):
+        gram = self._by_pair(get_all_correlation_pairs(self.df))
+        single = compute_correlation_from_data(self.df, "b", "c")
+        self.assertAlmostEqual(gram[("b", "c")]["p_value"], single["p_value"], places=12)
+        self.assertAlmostEqual(gram[("b", "c")]["r_value"], single["r_value"], places=12)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+"""
+Tests for the Tcl scripting helpers in gui_components.
+Run from the app folder with: python -m unittest discover tests
+"""
+
+import os
+import sys
+import tkinter as tk
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import customtkinter as ctk
+from gui_components import LabeledEntry, ResultsDisplay, _tag_pieces, _tcl_quote
+
+
+def _make_root():
+    """Create a CTk root, or skip the test when no display is available."""
+    try:
+        return ctk.CTk()
+    except tk.TclError as e:
+        raise unittest.SkipTest(f"no display: {e}")
+
+
+class TclQuoteTests(unittest.TestCase):
+    """_tcl_quote must round-trip any string as exactly one Tcl word."""
+
+    def setUp(self):
+        self.interp = tk.Tcl()
+
+    def test_round_trip(self):
+        for text in ["", "abc", "a b", "{", "}", "x\ny\tz\r", "$v [cmd]", '"q";', "\\", "α 📊"]:
+            with self.subTest(text=text):
+                self.assertEqual(self.interp.eval(f"set v {_tcl_quote(text)}"), text)
+
+    def test_empty_string_is_one_word(self):
+        script = f"llength [list {_tcl_quote('')} {_tcl_quote('a b')} {_tcl_quote('')}]"
+        self.assertEqual(self.interp.eval(script), "3")
+
+
+class _RecordingText:
+    """Stand-in for the results tk.Text: a Tcl command that records its arguments."""
+
+    def __init__(self, interp):
+        self.tk = interp
+        interp.eval("proc .results args { lappend ::calls $args }")
+
+    def __str__(self):
+        return ".results"
+
+    def calls(self):
+        return [list(self.tk.splitlist(c)) for c in self.tk.splitlist(self.tk.eval("set ::calls"))]
+
+
+class SetTextTests(unittest.TestCase):
+    """ResultsDisplay._set_text must send each chunk as its own Tcl word."""
+
+    def setUp(self):
+        self.display = ResultsDisplay.__new__(ResultsDisplay)
+        self.display.results_text = _RecordingText(tk.Tcl())
+
+    def test_tagged_chunks(self):
+        pieces = [("Title {1}\n", "heading"), ("$x = [y]", "body")]
+        self.display._set_text(pieces)
+        self.assertEqual(self.display.results_text.calls(), [
+            ["configure", "-state", "normal"],
+            ["delete", "1.0", "end"],
+            ["insert", "1.0", "Title {1}\n", "heading", "$x = [y]", "body"],
+            ["configure", "-state", "disabled"],
+        ])
+
+    def test_empty_chunks(self):
+        for pieces in ([], _tag_pieces(""), [("", "heading"), ("text", "body")]):
+            with self.subTest(pieces=pieces):
+                self.display.results_text.tk.eval("set ::calls {}")
+                self.display._set_text(pieces)
+                inserts = [c for c in self.display.results_text.calls() if c[0] == "insert"]
+                expected = [c for c, _ in pieces if c]
+                self.assertEqual([c[2::2] for c in inserts], [expected] if expected else [])
+
+
+class LabeledEntryTests(unittest.TestCase):
+    def setUp(self):
+        self.root = _make_root()
+        self.entry = LabeledEntry(self.root, "Alpha", default_value="0.05")
+
+    def tearDown(self):
+        self.root.destroy()
+
+    def test_set_replaces_text(self):
+        self.entry.set("0.01 {x}")
+        self.assertEqual(self.entry.get(), "0.01 {x}")
+
+    def test_set_empty_string(self):
+        self.entry.set("")
+        self.assertEqual(self.entry.get(), "")
+
+
+class ResultsDisplayThemeTests(unittest.TestCase):
+    def setUp(self):
+        self.mode = ctk.get_appearance_mode()
+        self.root = _make_root()
+        self.display = ResultsDisplay(self.root)
+        self.display._ensure_textbox()
+
+    def tearDown(self):
+        self.root.destroy()
+        ctk.set_appearance_mode(self.mode)
+
+    def test_follows_appearance_mode(self):
+        light, dark = ctk.ThemeManager.theme["CTkTextbox"]["fg_color"]
+        for mode, color in (("Light", light), ("Dark", dark)):
+            with self.subTest(mode=mode):
+                ctk.set_appearance_mode(mode)
+                self.assertEqual(self.display.results_text.cget("bg"), color)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,13 +1,85 @@
 import customtkinter as ctk
 from tkinter import filedialog, messagebox
-from scipy import stats
-from docx import Document
-from docx.shared import Pt, Inches
-from docx.enum.text import WD_ALIGN_PARAGRAPH
+import copy
+import io
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import re
+import warnings
 from datetime import datetime
 
+# Separators accepted between scores, all mapped to a newline so the text is
+# one value per line for both NumPy's and pandas' parsers
+_SEPARATORS = str.maketrans(', \r\t;', '\n\n\n\n\n')
+
+# Pastes at least this long (about a million scores) go through pandas'
+# C tokenizer, which overtakes np.fromstring at that size
+_LARGE_PASTE = 4_000_000
+
+# Numeric tokens (including decimals and negatives) for the mixed-text fallback
+_NUMBER_RE = re.compile(r'-?\d+\.?\d*')
+
+# Number of recent inputs whose results are kept for repeated clicks
+_CACHE_SIZE = 8
+
+# Shared CTkFont objects keyed by (size, weight)
+_FONTS = {}
+
+# Conclusions indexed by whether p <= alpha (a nan p-value reads as not significant)
+_CONCLUSIONS = (
+    "There is no significant difference between the two groups.",
+    "There is a significant difference between the two groups.",
+)
+
+# Results panel and report templates, bound once instead of rebuilt per click
+_RESULTS_TEMPLATE = """
+Independent Samples t-test Results
+{sep}
+
+Group 1:
+  Mean: {mean1:.4f}
+  Sample Size: {n1}
+
+Group 2:
+  Mean: {mean2:.4f}
+  Sample Size: {n2}
+
+Statistical Results:
+  t({df:.2f}) = {t_statistic:.4f}
+  p-value (two-tailed) = {p_value:.4f}
+  Alpha level: {alpha}
+
+Conclusion:
+  {conclusion}
+""".format
+_STATS_TEMPLATE = "t({df:.2f}) = {t_statistic:.4f}, p = {p_value:.4f}".format
+
+def _font(size, weight="normal"):
+    """Return the shared CTkFont for size/weight, creating it on first use"""
+    font = _FONTS.get((size, weight))
+    if font is None:
+        font = _FONTS[(size, weight)] = ctk.CTkFont(size=size, weight=weight)
+    return font
+
+
+def _warm_up():
+    """Import the t-test kernel and run it once so the first Compute click is fast"""
+    from _welch import welch_ttest
+    welch_ttest(np.array([0.0, 1.0]), np.array([0.0, 2.0]))
+
+
+class InputError(ValueError):
+    """Raised by the worker when the pasted scores fail validation"""
+
+
 class IndependentTTestApp:
+    # Blank report document, its table style and the report font sizes,
+    # built on the first save
+    _template = None
+    _table_style = None
+    _byline_size = None
+    _timestamp_size = None
+    
     def __init__(self, root):
         self.root = root
         self.root.title("Independent Samples t-test")
@@ -19,6 +91,18 @@ class IndependentTTestApp:
         # Results storage
         self.results = None
         
+        # Single worker for parse + stats; _pending is the computation whose
+        # result should still be shown
+        self._pool = ThreadPoolExecutor(max_workers=1)
+        self._pending = None
+        
+        # Load SciPy and the kernel on the worker while the window comes up;
+        # a Compute click submitted meanwhile simply queues behind it
+        self._pool.submit(_warm_up)
+        
+        # (group1_text, group2_text) -> (results, results_text) of recent computations
+        self._cache = {}
+        
         # Main frame
         main_frame = ctk.CTkFrame(self.root)
         main_frame.pack(fill="both", expand=True, padx=20, pady=20)
@@ -27,7 +111,7 @@ class IndependentTTestApp:
         title_label = ctk.CTkLabel(
             main_frame, 
             text="Independent Samples t-test", 
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=_font(24, "bold")
         )
         title_label.pack(pady=(0, 20))
         
@@ -39,7 +123,7 @@ class IndependentTTestApp:
         report_title_label = ctk.CTkLabel(
             metadata_frame, 
             text="Report Title:", 
-            font=ctk.CTkFont(size=13, weight="bold")
+            font=_font(13, "bold")
         )
         report_title_label.grid(row=0, column=0, sticky="w", padx=10, pady=5)
         
@@ -54,7 +138,7 @@ class IndependentTTestApp:
         byline_label = ctk.CTkLabel(
             metadata_frame, 
             text="By:", 
-            font=ctk.CTkFont(size=13, weight="bold")
+            font=_font(13, "bold")
         )
         byline_label.grid(row=1, column=0, sticky="w", padx=10, pady=5)
         
@@ -73,7 +157,7 @@ class IndependentTTestApp:
         group1_label = ctk.CTkLabel(
             main_frame, 
             text="Group 1 Scores (comma or newline separated):", 
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=_font(14, "bold")
         )
         group1_label.pack(anchor="w", padx=10)
         
@@ -84,7 +168,7 @@ class IndependentTTestApp:
         group2_label = ctk.CTkLabel(
             main_frame, 
             text="Group 2 Scores (comma or newline separated):", 
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=_font(14, "bold")
         )
         group2_label.pack(anchor="w", padx=10)
         
@@ -100,7 +184,7 @@ class IndependentTTestApp:
             button_frame, 
             text="Compute t-test", 
             command=self.compute_ttest,
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=_font(14, "bold"),
             width=150,
             height=35
         )
@@ -111,7 +195,7 @@ class IndependentTTestApp:
             button_frame, 
             text="Clear", 
             command=self.clear_fields,
-            font=ctk.CTkFont(size=14),
+            font=_font(14),
             width=100,
             height=35
         )
@@ -122,7 +206,7 @@ class IndependentTTestApp:
             button_frame, 
             text="Save Results to DOCX", 
             command=self.save_to_docx,
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=_font(14, "bold"),
             width=180,
             height=35,
             state="disabled"
@@ -133,7 +217,7 @@ class IndependentTTestApp:
         self.status_label = ctk.CTkLabel(
             main_frame, 
             text="", 
-            font=ctk.CTkFont(size=12)
+            font=_font(12)
         )
         self.status_label.pack(pady=5)
         
@@ -141,7 +225,7 @@ class IndependentTTestApp:
         results_label = ctk.CTkLabel(
             main_frame, 
             text="Results:", 
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=_font(14, "bold")
         )
         results_label.pack(anchor="w", padx=10, pady=(10, 5))
         
@@ -150,113 +234,174 @@ class IndependentTTestApp:
         self.results_text.configure(state="disabled")
     
     def parse_input(self, text):
-        """Parse input text and extract numeric values"""
-        # Replace newlines and commas with spaces
-        text = re.sub(r'[,\n\r\t]+', ' ', text)
-        # Extract all numeric values (including decimals and negatives)
-        values = re.findall(r'-?\d+\.?\d*', text)
-        # Convert to float
-        return [float(v) for v in values if v]
+        """Parse input text and extract numeric values as a float64 array"""
+        # Replace spaces, commas, tabs and semicolons with newlines
+        text = text.translate(_SEPARATORS)
+        # Fast path: tokenize and convert in a C parser
+        try:
+            with warnings.catch_warnings():
+                # Older NumPy versions warn instead of raising on non-numeric data
+                warnings.simplefilter("error", DeprecationWarning)
+                values = self._read_values(text)
+            if np.isfinite(values).all():
+                return values
+        except (ValueError, DeprecationWarning):
+            pass
+        # Mixed text: extract all numeric values (including decimals and negatives)
+        values = _NUMBER_RE.findall(text)
+        # Convert the matched strings to float in NumPy rather than a Python loop
+        return np.array(values, dtype=np.float64)
+    
+    @staticmethod
+    def _read_values(text):
+        """Convert one-value-per-line text to float64, raising ValueError on non-numeric data"""
+        if len(text) >= _LARGE_PASTE:
+            try:
+                import pandas as pd
+            except ImportError:
+                pd = None
+            if pd is not None:
+                return pd.read_csv(
+                    io.StringIO(text), header=None, dtype=np.float64, engine='c'
+                ).to_numpy().ravel()
+        # sep=' ' matches any run of whitespace, newlines included
+        return np.fromstring(text, sep=' ', dtype=np.float64)
     
     def compute_ttest(self):
         """Compute independent samples t-test"""
+        # Get input data
+        group1_text = self.group1_text.get("1.0", "end").strip()
+        group2_text = self.group2_text.get("1.0", "end").strip()
+        
+        # Validate inputs are not empty
+        if not group1_text or not group2_text:
+            messagebox.showerror("Input Error", "Please enter data for both groups.")
+            return
+        
+        # Same data as an earlier click: reuse its results, restamped for this run
+        key = (group1_text, group2_text)
+        cached = self._cache.get(key)
+        if cached is not None:
+            results, results_text = cached
+            self._pending = None
+            self._show_results(dict(results, timestamp=datetime.now()), results_text)
+            return
+        
+        # Parse and compute on the worker thread so large pastes don't freeze the window
+        self.compute_button.configure(state="disabled")
+        self.status_label.configure(text="Computing...", text_color="gray")
+        future = self._pool.submit(self._compute, group1_text, group2_text)
+        self._pending = future
+        future.add_done_callback(lambda f: self.root.after(0, self._apply_results, f, key))
+    
+    def _compute(self, group1_text, group2_text):
+        """Parse both groups and run the t-test, returning (results, results_text)"""
+        # Parse inputs (float64 arrays, kept as-is in the results)
+        group1_data = self.parse_input(group1_text)
+        group2_data = self.parse_input(group2_text)
+        n1 = group1_data.size
+        n2 = group2_data.size
+        
+        # Validate we have data
+        if n1 == 0 or n2 == 0:
+            raise InputError("No valid numeric values found. Please enter numeric data.")
+        
+        # Validate minimum sample size
+        if n1 < 2 or n2 < 2:
+            raise InputError("Each group must have at least 2 values.")
+        
+        # Imported on first use so startup doesn't load SciPy (or compile the kernel)
+        from _welch import ZeroVarianceError, welch_ttest
+        
+        # Perform Welch's t-test (unequal variances, Welch-Satterthwaite df)
         try:
-            # Get input data
-            group1_text = self.group1_text.get("1.0", "end").strip()
-            group2_text = self.group2_text.get("1.0", "end").strip()
-            
-            # Validate inputs are not empty
-            if not group1_text or not group2_text:
-                messagebox.showerror("Input Error", "Please enter data for both groups.")
-                return
-            
-            # Parse inputs
-            group1_data = self.parse_input(group1_text)
-            group2_data = self.parse_input(group2_text)
-            
-            # Validate we have data
-            if len(group1_data) == 0 or len(group2_data) == 0:
-                messagebox.showerror("Input Error", "No valid numeric values found. Please enter numeric data.")
-                return
-            
-            # Validate minimum sample size
-            if len(group1_data) < 2 or len(group2_data) < 2:
-                messagebox.showerror("Input Error", "Each group must have at least 2 values.")
-                return
-            
-            # Compute statistics
-            mean1 = sum(group1_data) / len(group1_data)
-            mean2 = sum(group2_data) / len(group2_data)
-            n1 = len(group1_data)
-            n2 = len(group2_data)
-            
-            # Perform Welch's t-test (equal_var=False)
-            t_statistic, p_value = stats.ttest_ind(group1_data, group2_data, equal_var=False)
-            
-            # Calculate degrees of freedom for Welch's t-test
-            var1 = sum((x - mean1) ** 2 for x in group1_data) / (n1 - 1)
-            var2 = sum((x - mean2) ** 2 for x in group2_data) / (n2 - 1)
-            df = ((var1/n1 + var2/n2) ** 2) / ((var1/n1)**2/(n1-1) + (var2/n2)**2/(n2-1))
-            
-            # Determine significance
-            alpha = 0.05
-            if p_value <= alpha:
-                conclusion = "There is a significant difference between the two groups."
-            else:
-                conclusion = "There is no significant difference between the two groups."
-            
-            # Store results
-            self.results = {
-                'group1_data': group1_data,
-                'group2_data': group2_data,
-                'mean1': mean1,
-                'mean2': mean2,
-                'n1': n1,
-                'n2': n2,
-                't_statistic': t_statistic,
-                'df': df,
-                'p_value': p_value,
-                'conclusion': conclusion,
-                'timestamp': datetime.now()
-            }
-            
-            # Display results
-            results_text = f"""
-Independent Samples t-test Results
-{'=' * 50}
-
-Group 1:
-  Mean: {mean1:.4f}
-  Sample Size: {n1}
-
-Group 2:
-  Mean: {mean2:.4f}
-  Sample Size: {n2}
-
-Statistical Results:
-  t({df:.2f}) = {t_statistic:.4f}
-  p-value (two-tailed) = {p_value:.4f}
-  Alpha level: {alpha}
-
-Conclusion:
-  {conclusion}
-"""
-            
-            self.results_text.configure(state="normal")
-            self.results_text.delete("1.0", "end")
-            self.results_text.insert("1.0", results_text)
-            self.results_text.configure(state="disabled")
-            
-            # Update status
-            self.status_label.configure(text="✓ Computation successful", text_color="green")
-            
-            # Enable save button
-            self.save_button.configure(state="normal")
-            
+            means, variances, t_statistic, df, p_value = welch_ttest(group1_data, group2_data)
+        except ZeroVarianceError as e:
+            raise InputError(str(e)) from None
+        
+        # Determine significance
+        alpha = 0.05
+        conclusion = _CONCLUSIONS[bool(p_value <= alpha)]
+        
+        # Per-group statistics are stored as parallel arrays, one entry per group
+        results = {
+            'datas': [group1_data, group2_data],
+            'means': means,
+            'vars': variances,
+            'ns': np.array([n1, n2]),
+            't_statistic': t_statistic,
+            'df': df,
+            'p_value': p_value,
+            'conclusion': conclusion,
+            'timestamp': datetime.now()
+        }
+        
+        results_text = _RESULTS_TEMPLATE(
+            sep='=' * 50, mean1=means[0], n1=n1, mean2=means[1], n2=n2, df=df,
+            t_statistic=t_statistic, p_value=p_value, alpha=alpha, conclusion=conclusion
+        )
+        return results, results_text
+    
+    def _apply_results(self, future, key):
+        """Show a finished computation on the UI thread"""
+        # Ignore results that were cleared (or superseded) while computing
+        if future is not self._pending:
+            return
+        self._pending = None
+        self.compute_button.configure(state="normal")
+        self.status_label.configure(text="")
+        
+        try:
+            results, results_text = future.result()
+        except InputError as e:
+            messagebox.showerror("Input Error", str(e))
+            return
         except ValueError as e:
             messagebox.showerror("Input Error", f"Invalid input: {str(e)}\nPlease enter only numeric values.")
+            return
         except Exception as e:
             messagebox.showerror("Error", f"An error occurred: {str(e)}")
+            return
+        
+        # Remember the last few inputs, dropping the oldest entry when full
+        if len(self._cache) >= _CACHE_SIZE:
+            del self._cache[next(iter(self._cache))]
+        self._cache[key] = (results, results_text)
+        
+        self._show_results(results, results_text)
+    
+    def _show_results(self, results, results_text):
+        """Store results and show them in the results panel"""
+        self.compute_button.configure(state="normal")
+        
+        # Store results
+        self.results = results
+        
+        # Display results
+        self.results_text.configure(state="normal")
+        self.results_text.delete("1.0", "end")
+        self.results_text.insert("1.0", results_text)
+        self.results_text.configure(state="disabled")
+        
+        # Update status
+        self.status_label.configure(text="✓ Computation successful", text_color="green")
+        
+        # Enable save button
+        self.save_button.configure(state="normal")
+    
+    @classmethod
+    def _new_document(cls):
+        """Return a fresh document copied from the cached blank template"""
+        if cls._template is None:
+            # Imported here so python-docx only loads once a report is saved
+            from docx import Document
+            from docx.shared import Pt
+            
+            cls._template = Document()
+            cls._table_style = cls._template.styles['Light Grid Accent 1']
+            cls._byline_size = Pt(12)
+            cls._timestamp_size = Pt(10)
+        return copy.deepcopy(cls._template)
     
     def save_to_docx(self):
         """Save results to a DOCX file"""
@@ -283,8 +428,10 @@ Conclusion:
             if not report_title:
                 report_title = "Independent Samples t-test Results"
             
+            from docx.enum.text import WD_ALIGN_PARAGRAPH
+            
             # Create document
-            doc = Document()
+            doc = self._new_document()
             
             # Add title
             title = doc.add_heading(report_title, 0)
@@ -292,59 +439,45 @@ Conclusion:
             
             # Add byline if provided
             if byline:
-                byline_paragraph = doc.add_paragraph(f"By: {byline}")
+                byline_paragraph = doc.add_paragraph()
                 byline_paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                byline_run = byline_paragraph.runs[0]
-                byline_run.font.size = Pt(12)
+                byline_run = byline_paragraph.add_run(f"By: {byline}")
+                byline_run.font.size = self._byline_size
                 byline_run.italic = True
             
             # Add timestamp
             timestamp_str = self.results['timestamp'].strftime("%B %d, %Y at %I:%M %p")
-            timestamp_paragraph = doc.add_paragraph(f"Generated: {timestamp_str}")
+            timestamp_paragraph = doc.add_paragraph()
             timestamp_paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            timestamp_run = timestamp_paragraph.runs[0]
-            timestamp_run.font.size = Pt(10)
+            timestamp_run = timestamp_paragraph.add_run(f"Generated: {timestamp_str}")
+            timestamp_run.font.size = self._timestamp_size
             timestamp_run.font.color.rgb = None  # Gray color
             
             doc.add_paragraph()
             
             # Add descriptive statistics table
-            table = doc.add_table(rows=3, cols=3)
-            table.style = 'Light Grid Accent 1'
-            
-            # Header row
-            header_cells = table.rows[0].cells
-            header_cells[0].text = 'Group'
-            header_cells[1].text = 'Mean'
-            header_cells[2].text = 'Sample Size'
-            
-            # Make header bold
-            for cell in header_cells:
-                for paragraph in cell.paragraphs:
-                    for run in paragraph.runs:
-                        run.font.bold = True
-            
-            # Group 1 data
-            row1_cells = table.rows[1].cells
-            row1_cells[0].text = 'Group 1'
-            row1_cells[1].text = f"{self.results['mean1']:.4f}"
-            row1_cells[2].text = str(self.results['n1'])
+            rows = [('Group', 'Mean', 'Sample Size')]
+            rows.extend(
+                (f"Group {i}", f"{mean:.4f}", str(n))
+                for i, (mean, n) in enumerate(zip(self.results['means'], self.results['ns']), 1)
+            )
+            table = doc.add_table(rows=len(rows), cols=3)
+            table.style = self._table_style
             
-            # Group 2 data
-            row2_cells = table.rows[2].cells
-            row2_cells[0].text = 'Group 2'
-            row2_cells[1].text = f"{self.results['mean2']:.4f}"
-            row2_cells[2].text = str(self.results['n2'])
+            # Add one run to each cell's existing paragraph (header runs bold)
+            # instead of rebuilding the cell through cell.text
+            for row_index, (row, texts) in enumerate(zip(table.rows, rows)):
+                for cell, text in zip(row.cells, texts):
+                    run = cell.paragraphs[0].add_run(text)
+                    if row_index == 0:
+                        run.bold = True
             
             doc.add_paragraph()
             
             # Add statistical results
             results_heading = doc.add_heading('Statistical Results', 2)
             
-            stats_text = (
-                f"t({self.results['df']:.2f}) = {self.results['t_statistic']:.4f}, "
-                f"p = {self.results['p_value']:.4f}"
-            )
+            stats_text = _STATS_TEMPLATE(**self.results)
             doc.add_paragraph(stats_text)
             
             doc.add_paragraph()
@@ -374,6 +507,9 @@ Conclusion:
         self.byline_entry.delete(0, "end")
         self.status_label.configure(text="")
         self.results = None
+        self._pending = None
+        self._cache.clear()
+        self.compute_button.configure(state="normal")
         self.save_button.configure(state="disabled")
 
 def main():